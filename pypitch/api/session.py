@@ -65,8 +65,10 @@ class PyPitchSession:
         print(f"Loading match {match_id}...")
         try:
             data = self.loader.get_match(match_id)
-            table = canonicalize_match(data, self.registry, match_id)
+            with self.registry.batch():
+                table = canonicalize_match(data, self.registry, match_id)
             self.engine.ingest_events(table, snapshot_tag=f"match_{match_id}", append=True)
+            self.engine.flush()
             print(f"Match {match_id} loaded successfully.")
         except Exception as e:
             print(f"Failed to load match {match_id}: {e}")
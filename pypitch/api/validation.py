@@ -17,20 +17,6 @@ class WinPredictionRequest(BaseModel):
     overs_done: float = Field(..., ge=0.0, le=20.0, description="Overs completed")
     venue: Optional[str] = Field(None, max_length=100, description="Venue name")
 
-    @field_validator('overs_done')
-    @classmethod
-    def validate_overs_done(cls, v):
-        if v < 0 or v > 20:
-            raise ValueError('overs_done must be between 0 and 20')
-        return v
-
-    @field_validator('wickets_down')
-    @classmethod
-    def validate_wickets_down(cls, v):
-        if v < 0 or v > 10:
-            raise ValueError('wickets_down must be between 0 and 10')
-        return v
-
 class PlayerLookupRequest(BaseModel):
     """Request model for player lookup."""
     name: str = Field(..., min_length=1, max_length=100, description="Player name")
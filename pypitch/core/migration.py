@@ -139,10 +139,11 @@ class SchemaMigration:
 
             for table_name, expected_columns in expected_tables.items():
                 # Check if table exists
-                table_exists = con.execute(f"""
-                    SELECT COUNT(*) FROM information_schema.tables
-                    WHERE table_name = '{table_name}'
-                """).fetchone()[0] > 0
+                table_exists = con.execute("""
+                    SELECT 1 FROM information_schema.tables
+                    WHERE table_name = ?
+                    LIMIT 1
+                """, [table_name]).fetchone() is not None
 
                 if not table_exists:
                     results["issues"].append(f"Missing table: {table_name}")
@@ -150,12 +151,12 @@ class SchemaMigration:
                     continue
 
                 # Check columns
-                actual_columns = con.execute(f"""
+                actual_columns = con.execute("""
                     SELECT column_name
                     FROM information_schema.columns
-                    WHERE table_name = '{table_name}'
+                    WHERE table_name = ?
                     ORDER BY ordinal_position
-                """).fetchall()
+                """, [table_name]).fetchall()
 
                 actual_column_names = [col[0] for col in actual_columns]
 
@@ -217,8 +218,8 @@ class SchemaMigrator:
     def _needs_migration(self, parquet_file: Path) -> bool:
         """Check if a Parquet file needs schema migration."""
         try:
-            table = pa.parquet.read_table(parquet_file)
-            current_schema = table.schema
+            # Only the footer is parsed; no column data is read
+            current_schema = pq.read_metadata(parquet_file).schema.to_arrow_schema()
 
             # Check for missing columns that were added in newer versions
             required_fields = ['is_impact_player']  # Example: new field for impact player
@@ -84,6 +84,11 @@ class StreamIngestor:
             self.webhook_server.shutdown()
 
         self.executor.shutdown(wait=True)
+
+        # Persist deliveries the engine is still buffering
+        flush_live = getattr(self.query_engine, "flush_live", None)
+        if flush_live is not None:
+            flush_live()
         logger.info("Live data ingestion pipeline stopped")
 
     def register_match(self, match_id: str, source: str, metadata: Dict[str, Any] = None) -> bool:
@@ -1,7 +1,9 @@
 import hashlib
 import json
-from typing import Dict, Optional, Any, List
+from functools import cached_property
+from typing import Dict, Optional, Any, List, Mapping
 from pydantic import BaseModel, Field, ConfigDict
+from typing_extensions import Self
 
 class ExecutionOptions(BaseModel):
     """Runtime controls that do NOT affect the data definition."""
@@ -15,6 +17,12 @@ class BaseQuery(BaseModel):
     snapshot_id: str
     execution_opts: ExecutionOptions = Field(default_factory=ExecutionOptions, exclude=True)
 
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> Self:
+        # The copy shares our __dict__, including a cached cache_key that may no longer match
+        copy = super().model_copy(update=update, deep=deep)
+        copy.__dict__.pop("cache_key", None)
+        return copy
+
     @property
     def requires(self) -> Dict[str, Any]:
         """
@@ -29,11 +37,12 @@ class BaseQuery(BaseModel):
         """
         raise NotImplementedError("Query subclass must implement requires property.")
 
-    @property
+    @cached_property
     def cache_key(self) -> str:
         """
         Generates a deterministic SHA256 hash of the INTENT only.
         Crucially, it excludes execution_opts because of the exclude=True above.
+        Queries are frozen, so the hash is computed once per instance.
         """
         # 1. Dump model to dict, excluding runtime opts
         canonical_dict = self.model_dump(exclude={"execution_opts"})
@@ -80,7 +80,7 @@ class RuntimeExecutor:
 
         # Use legacy plan for now to maintain backward compatibility with existing tests
         plan = self.planner.create_legacy_plan(query)
-        result_table = self.engine.execute_sql(plan["sql"])
+        result_table = self.engine.execute_sql(plan["sql"], cache=True)
         if modes.debug_mode and hasattr(result_table, 'collect'):
             result_table = result_table.collect()
         self.cache.set(query_hash, result_table)
@@ -130,7 +130,7 @@ class RuntimeExecutor:
 
         # 4. Execute: Let DuckDB do the heavy lifting (JOIN)
         # This returns an Arrow Table with 'runs' AND 'venue_avg_sr' columns
-        enriched_events = self.engine.execute_sql(sql_plan)
+        enriched_events = self.engine.execute_sql(sql_plan, cache=True)
 
         # 5. Compute: Run the Pure Function
         # The metric simply expects column 'venue_avg_sr' to exist
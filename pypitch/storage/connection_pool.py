@@ -2,6 +2,7 @@
 Connection pooling for database engines.
 """
 
+import os
 import threading
 import time
 from typing import Any
@@ -11,24 +12,73 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_CGROUP_MEMORY_MAX = "/sys/fs/cgroup/memory.max"
+
+def _cgroup_memory_limit() -> int | None:
+    """The cgroup v2 memory limit in bytes, or None when unset or unreadable."""
+    try:
+        with open(_CGROUP_MEMORY_MAX) as f:
+            value = f.read().strip()
+    except OSError:
+        return None
+    return int(value) if value.isdigit() else None
+
+def _default_memory_limit() -> str:
+    """
+    60% of available memory, capped at 8GB; 2GB when it cannot be read.
+    Inside a container the cgroup limit applies rather than host RAM.
+    """
+    try:
+        total = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        total = None
+    cgroup = _cgroup_memory_limit()
+    if cgroup is not None:
+        total = cgroup if total is None else min(total, cgroup)
+    if total is None:
+        return "2GB"
+    mb = min(int(total * 0.6), 8 * 1024 ** 3) // (1024 ** 2)
+    return f"{mb}MB"
+
 class ConnectionPool:
     """Thread-safe connection pool for database connections."""
 
-    def __init__(self, db_path: str, max_connections: int = 10, max_idle_time: int = 300) -> None:
+    def __init__(self, db_path: str, max_connections: int = 10, max_idle_time: int = 300,
+                 threads: int | None = None, memory_limit: str | None = None,
+                 preserve_insertion_order: bool = True,
+                 temp_directory: str | None = None) -> None:
         self.db_path = db_path
         self.max_connections = max_connections
         self.max_idle_time = max_idle_time
+        self.threads = threads or os.cpu_count() or 4
+        self.memory_limit = memory_limit or _default_memory_limit()
+        self.preserve_insertion_order = preserve_insertion_order
+        self.temp_directory = temp_directory
         self._connections: list[dict[str, Any]] = []
         self._condition = threading.Condition(threading.Lock())
         self._closed = False
+        self._root: duckdb.DuckDBPyConnection | None = None
 
     def _create_connection(self) -> duckdb.DuckDBPyConnection:
-        """Create a new database connection."""
-        con = duckdb.connect(self.db_path)
-        # Performance tuning
-        con.execute("PRAGMA threads=4;")
-        con.execute("PRAGMA memory_limit='2GB';")
-        return con
+        """
+        Create a new cursor on the pool's single database instance.
+
+        Separate duckdb.connect() calls would give each ":memory:" connection
+        its own empty database, and DuckDB refuses a second handle on the same
+        file with a different configuration. Cursors share one instance, so
+        readers run concurrently under MVCC.
+        """
+        if self._root is None:
+            self._root = duckdb.connect(self.db_path)
+            # Performance tuning (database-wide settings)
+            self._root.execute(f"PRAGMA threads={int(self.threads)};")
+            self._root.execute("SET memory_limit = ?", [self.memory_limit])
+            self._root.execute("SET preserve_insertion_order = ?", [self.preserve_insertion_order])
+            self._root.execute("PRAGMA enable_object_cache;")
+            if self.temp_directory:
+                # Spill location for aggregates/joins that exceed memory_limit
+                self._root.execute("SET temp_directory = ?", [self.temp_directory])
+        return self._root.cursor()
 
     def _is_connection_valid(self, conn_info: dict) -> bool:
         """Check if a connection is still valid."""
@@ -128,6 +178,12 @@ class ConnectionPool:
                 except Exception as e:
                     logger.warning("Error closing connection: %s", e)
             self._connections.clear()
+            if self._root is not None:
+                try:
+                    self._root.close()
+                except Exception as e:
+                    logger.warning("Error closing connection: %s", e)
+                self._root = None
             self._closed = True
 
     @contextmanager
@@ -1,20 +1,51 @@
 import duckdb
 import pyarrow as pa
 import logging
-from typing import Any, Optional
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Union
 from pypitch.schema.v1 import BALL_EVENT_SCHEMA
 from pypitch.storage.connection_pool import ConnectionPool
 
 logger = logging.getLogger(__name__)
 
+# Catalog functions instead of the information_schema.tables view, which is
+# about 2x slower to bind and scan for a single-name probe.
+_TABLE_EXISTS_SQL = (
+    "SELECT 1 FROM duckdb_tables() WHERE table_name = $1 "
+    "UNION ALL SELECT 1 FROM duckdb_views() WHERE view_name = $1 AND NOT internal "
+    "LIMIT 1"
+)
+
+# One batch per 60 DuckDB vectors (2048 rows each)
+_STREAM_BATCH_ROWS = 122_880
+
+def _record_batch_reader(con, rows_per_batch: int = _STREAM_BATCH_ROWS) -> pa.RecordBatchReader:
+    """Streams the pending result of con in Arrow record batches."""
+    # to_arrow_reader replaced fetch_record_batch in newer DuckDB releases
+    if hasattr(con, "to_arrow_reader"):
+        return con.to_arrow_reader(rows_per_batch)
+    return con.fetch_record_batch(rows_per_batch)
+
 class QueryEngine:
-    def __init__(self, db_path: str = ":memory:") -> None:
+    def __init__(self, db_path: str = ":memory:", threads: Optional[int] = None,
+                 memory_limit: Optional[str] = None) -> None:
         """
         Initializes the DuckDB engine with connection pooling.
         :memory: is fast but volatile. Use a path for persistence.
+        threads / memory_limit default to all cores and 60% of RAM (max 8GB).
         """
         self.db_path = db_path
-        self.pool = ConnectionPool(db_path, max_connections=5)
+        # Readers share one database instance through cursors; DuckDB allows a
+        # single writer, so writes are serialized on _write_lock instead.
+        self.pool = ConnectionPool(
+            db_path,
+            max_connections=max(4, os.cpu_count() or 1),
+            threads=threads,
+            memory_limit=memory_limit,
+        )
+        self._write_lock = threading.Lock()
 
         # Initialize database schema on first connection
         with self.pool.connection() as con:
@@ -24,8 +55,38 @@ class QueryEngine:
         self._snapshot_id = "initial_empty"
         self._derived_versions: dict[str, str] = {}
 
+        # Tables confirmed to exist; saves an information_schema hit per write
+        self._known_tables: set[str] = set()
+
+        # Small appends are buffered and written as one Arrow table, so
+        # streaming ingest pays one register/INSERT cycle per flush.
+        # _pending_lock is held across each flush's write, so batches leave
+        # the buffer only once they are in ball_events.
+        self.flush_threshold_rows = 50_000
+        self._pending_batches: list[pa.Table] = []
+        self._pending_rows = 0
+        self._pending_snapshot: Optional[str] = None
+        self._pending_lock = threading.Lock()
+
+        # Fold the WAL into the database file every N event writes so a long
+        # streaming ingest keeps a bounded WAL (file-backed databases only).
+        self.checkpoint_every = 32
+        self._writes_since_checkpoint = 0
+
+        # LRU of read query results, for callers that pass cache=True
+        # (plots and the query executor). Keys carry the snapshot and a write
+        # counter, so any write makes earlier entries unreachable. The
+        # counter moves only after a write has committed.
+        self.result_cache_size = 64
+        self._result_cache: OrderedDict[Hashable, pa.Table] = OrderedDict()
+        self._data_version = 0
+        self._cache_lock = threading.Lock()
+
     @property
     def snapshot_id(self) -> str:
+        # Buffered appends are written first, so the snapshot a caller sees
+        # always describes persisted data
+        self.flush()
         return self._snapshot_id
 
     @property
@@ -37,62 +98,153 @@ class QueryEngine:
         Ingests strict Schema V1 Arrow Tables.
         Rejects anything that doesn't match the contract.
         """
+        # schema.equals is a C++ field walk (~0.1us for V1). Memoizing on
+        # id(schema) never hits, since pyarrow returns a fresh Schema wrapper
+        # on each .schema access.
         if not arrow_table.schema.equals(BALL_EVENT_SCHEMA):
             # In a real system, we might diff the schemas to give a better error
             raise ValueError("Schema Violation: Input does not match BALL_EVENT_SCHEMA v1")
 
-        # Debug: log incoming table info
-        try:
-            incoming_rows = getattr(arrow_table, 'num_rows', None)
-        except Exception:
-            incoming_rows = None
-        print(f"[QueryEngine.ingest_events] snapshot_tag={snapshot_tag} append={append} incoming_rows={incoming_rows}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ingest_events snapshot_tag=%s append=%s incoming_rows=%s",
+                         snapshot_tag, append, arrow_table.num_rows)
 
-        with self.pool.connection() as con:
+        if append:
+            with self._pending_lock:
+                self._pending_batches.append(arrow_table)
+                self._pending_rows += arrow_table.num_rows
+                # snapshot_id advances when these rows are written
+                self._pending_snapshot = snapshot_tag
+                full = self._pending_rows >= self.flush_threshold_rows
+            if full:
+                self.flush()
+            return
+
+        with self._pending_lock:
+            # A replace supersedes anything still buffered for the old table
+            self._pending_batches = []
+            self._pending_rows = 0
+            self._pending_snapshot = None
+            self._write_events(arrow_table, append=False)
+            self._snapshot_id = snapshot_tag
+
+    def flush(self) -> None:
+        """Writes any buffered append batches to ball_events.
+
+        If the write fails the batches stay buffered and the error propagates.
+        """
+        if not self._pending_batches:
+            return
+        with self._pending_lock:
+            if not self._pending_batches:
+                return
+            batches = self._pending_batches
+            combined = batches[0] if len(batches) == 1 else pa.concat_tables(batches)
+            self._write_events(combined, append=True)
+            self._pending_batches = []
+            self._pending_rows = 0
+            self._snapshot_id = self._pending_snapshot
+            self._pending_snapshot = None
+
+    def _invalidate_results(self) -> None:
+        """Called under _write_lock once a write has committed."""
+        with self._cache_lock:
+            self._data_version += 1
+            self._result_cache.clear()
+
+    def _write_events(self, arrow_table: pa.Table, append: bool) -> None:
+        with self._write_lock, self.pool.connection() as con:
             # Registers the Arrow table as a queryable view in DuckDB
             # This is a zero-copy operation (pointers only)
             con.register('arrow_view', arrow_table)
             try:
-                exists = self.table_exists("ball_events", con)
-                print(f"[QueryEngine.ingest_events] ball_events exists={exists}")
+                exists = self._table_exists("ball_events", con)
 
                 # Persist to disk
                 if append and exists:
-                    print("[QueryEngine.ingest_events] Performing INSERT INTO ball_events FROM arrow_view")
                     con.execute("INSERT INTO ball_events SELECT * FROM arrow_view")
                 else:
-                    print("[QueryEngine.ingest_events] Creating or replacing ball_events from arrow_view")
                     con.execute("CREATE OR REPLACE TABLE ball_events AS SELECT * FROM arrow_view")
+                    self._known_tables.add("ball_events")
+                self._invalidate_results()
 
-                # Check resulting row count for quick verification
-                try:
-                    res = con.execute("SELECT COUNT(*) FROM ball_events").fetchone()
-                    print(f"[QueryEngine.ingest_events] ball_events row_count_after_write={res[0] if res else 'unknown'}")
-                except Exception as e:
-                    print(f"[QueryEngine.ingest_events] Failed to fetch row count after write: {e}")
+                self._writes_since_checkpoint += 1
+                if self.db_path != ":memory:" and self._writes_since_checkpoint >= self.checkpoint_every:
+                    con.execute("CHECKPOINT")
+                    self._writes_since_checkpoint = 0
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    # The INSERT is unconditional, so the written count is the input size
+                    logger.debug("ingest_events ball_events existed=%s rows_written=%s",
+                                 exists, arrow_table.num_rows)
             finally:
                 try:
                     con.unregister('arrow_view')
                 except Exception:
                     pass
 
-    def execute_sql(self, sql: str, params: Optional[list] = None, read_only: bool = True) -> pa.Table:
+    def execute_sql(self, sql: str, params: Optional[list] = None, read_only: bool = True,
+                    stream: bool = False, cache: bool = False) -> Union[pa.Table, pa.RecordBatchReader]:
         """
         Execute a SQL query and return results as a PyArrow Table.
+        With stream=True a RecordBatchReader is returned instead, so large
+        scans can be consumed batch by batch without materializing them.
+        With cache=True a deterministic read is served from the result
+        cache until the next write; probes and ad-hoc SQL leave it off.
         """
         if params is None:
             params = []
 
-        with self.pool.connection() as con:
-            if not read_only:
+        self.flush()
+        if not read_only:
+            with self._write_lock, self.pool.connection() as con:
+                # Arbitrary DDL may drop tables; re-check existence afterwards
+                self._known_tables.clear()
                 con.execute(sql, params)
-                return pa.Table.from_pylist([]) # Return empty table for non-select queries
-            
-            result = con.execute(sql, params).arrow()
-            # Ensure we return a Table, not a RecordBatchReader
-            if isinstance(result, pa.RecordBatchReader):
-                return result.read_all()
-            return result
+                self._invalidate_results()
+            return pa.Table.from_pylist([]) # Return empty table for non-select queries
+
+        if stream:
+            with self.pool.connection() as con:
+                # A private cursor owns the result, so the pooled one can be
+                # reused while the caller is still reading batches.
+                cursor = con.cursor()
+            cursor.execute(sql, params)
+            return _record_batch_reader(cursor)
+
+        key = self._result_cache_key(sql, params) if cache else None
+        if key is not None:
+            with self._cache_lock:
+                cached = self._result_cache.get(key)
+                if cached is not None:
+                    self._result_cache.move_to_end(key)
+                    return cached
+
+        with self.pool.connection() as con:
+            con.execute(sql, params)
+            result = _record_batch_reader(con).read_all()
+
+        if key is not None:
+            with self._cache_lock:
+                self._result_cache[key] = result
+                if len(self._result_cache) > self.result_cache_size:
+                    self._result_cache.popitem(last=False)
+        return result
+
+    def _result_cache_key(self, sql: str, params: list) -> Optional[Hashable]:
+        """Cache key for a read query, or None if it should not be cached."""
+        if self.result_cache_size <= 0:
+            return None
+        head = sql.lstrip()[:6].upper()
+        if not (head.startswith("SELECT") or head.startswith("WITH")):
+            return None
+        with self._cache_lock:
+            key = (sql, tuple(params), self._snapshot_id, self._data_version)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
 
     def run(self, plan: dict[str, Any]) -> pa.Table:
         """
@@ -106,9 +258,10 @@ class QueryEngine:
         """
         Insert live delivery data.
         """
-        with self.pool.connection() as con:
+        self.flush()
+        with self._write_lock, self.pool.connection() as con:
             # Ensure table exists
-            if not self.table_exists("ball_events", con):
+            if not self._table_exists("ball_events", con):
                 # Create table if not exists (simplified schema for demo)
                 # Note: In real app, use full schema
                 con.execute("""
@@ -120,6 +273,7 @@ class QueryEngine:
                     is_wicket BOOLEAN DEFAULT FALSE, batter VARCHAR DEFAULT '', bowler VARCHAR DEFAULT ''
                 )
                 """)
+                self._known_tables.add("ball_events")
 
             con.execute("""
                 INSERT INTO ball_events (
@@ -137,9 +291,11 @@ class QueryEngine:
                 delivery_data.get('venue'),
                 delivery_data.get('timestamp')
             ])
+            self._invalidate_results()
 
     def table_exists(self, table_name: str, con=None) -> bool:
         """Checks if a table exists in the database."""
+        self.flush()
         if con is None:
             with self.pool.connection() as con:
                 return self._table_exists(table_name, con)
@@ -148,17 +304,25 @@ class QueryEngine:
 
     def _table_exists(self, table_name: str, con) -> bool:
         """Checks if a table exists using the provided connection."""
+        if table_name in self._known_tables:
+            return True
         try:
             # DuckDB specific query
-            res = con.execute("SELECT count(*) FROM information_schema.tables WHERE table_name = ?", [table_name]).fetchone()
-            return res[0] > 0 if res else False
+            exists = con.execute(_TABLE_EXISTS_SQL, [table_name]).fetchone() is not None
+            if exists:
+                self._known_tables.add(table_name)
+            return exists
         except duckdb.Error as e:
             logger.warning("Error checking table existence: %s", e)
             return False
 
     def close(self) -> None:
-        """Close the database connection pool."""
-        self.pool.close()
+        """Flush buffered events and close the database connection pool."""
+        try:
+            self.flush()
+        finally:
+            self._known_tables.clear()
+            self.pool.close()
 
 # Alias for backward compatibility if needed, but we will update references
 StorageEngine = QueryEngine
@@ -1,6 +1,70 @@
 import duckdb
+import pyarrow as pa
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import date
-from typing import Optional, Dict, cast, Any
+from typing import Optional, Dict, Iterator, List, Tuple, cast, Any
+
+# Statements reused on the resolve hot path. The DuckDB Python client has no
+# prepared-statement handle, so these are kept as constants and executed with
+# bound parameters.
+_ALIAS_LOOKUP_SQL = """
+    SELECT entity_id
+    FROM aliases
+    WHERE alias = ?
+      AND ? BETWEEN valid_from AND valid_to
+"""
+# Fallback for open-ended rows written with an explicit NULL valid_to
+_OPEN_ALIAS_LOOKUP_SQL = """
+    SELECT entity_id
+    FROM aliases
+    WHERE alias = ?
+      AND valid_to IS NULL
+      AND valid_from <= ?
+"""
+_RESERVE_IDS_SQL = "SELECT nextval('entity_id_seq') FROM range(?)"
+_ID_BLOCK_SIZE = 1000
+# valid_to for aliases that are still current (the column default); NULL is
+# still accepted on read
+_OPEN_ENDED = date(9999, 12, 31)
+_VALID_TO_DEFAULT_SQL = """
+    SELECT column_default FROM duckdb_columns()
+    WHERE table_name = 'aliases' AND column_name = 'valid_to'
+"""
+_INSERT_ENTITY_SQL = "INSERT INTO entities VALUES (?, ?, ?)"
+_INSERT_ALIAS_IF_ABSENT_SQL = """
+    INSERT INTO aliases (alias, entity_id, valid_from, valid_to)
+    SELECT $1, $2, $3, DATE '9999-12-31'
+    WHERE NOT EXISTS (
+        SELECT 1 FROM aliases
+        WHERE alias = $1
+          AND $3 BETWEEN valid_from AND valid_to
+        UNION ALL
+        SELECT 1 FROM aliases
+        WHERE alias = $1
+          AND valid_to IS NULL
+          AND valid_from <= $3
+    )
+    RETURNING entity_id
+"""
+_UPSERT_PLAYER_STATS_SQL = """
+    INSERT INTO player_stats SELECT * FROM upsert_view
+    ON CONFLICT (entity_id) DO UPDATE SET
+        matches = excluded.matches,
+        runs = excluded.runs,
+        balls_faced = excluded.balls_faced,
+        wickets = excluded.wickets,
+        balls_bowled = excluded.balls_bowled,
+        runs_conceded = excluded.runs_conceded
+"""
+_UPSERT_VENUE_STATS_SQL = """
+    INSERT INTO venue_stats SELECT * FROM upsert_view
+    ON CONFLICT (entity_id) DO UPDATE SET
+        matches = excluded.matches,
+        total_runs = excluded.total_runs,
+        first_innings_runs = excluded.first_innings_runs,
+        first_innings_count = excluded.first_innings_count
+"""
 
 class EntityNotFoundError(Exception):
     """Raised when an entity cannot be resolved and auto-ingest is disabled."""
@@ -9,8 +73,17 @@ class EntityNotFoundError(Exception):
 class IdentityRegistry:
     def __init__(self, db_path: str = "pypitch_registry.db") -> None:
         self.path = db_path
+        # Bounded LRU of resolved (entity_type, name, match_date) -> entity_id
+        self._cache: "OrderedDict[Tuple[str, str, date], int]" = OrderedDict()
+        self._cache_max = 200_000
+        # alias -> [(valid_from, valid_to, entity_id)], preloaded so repeat
+        # resolves of known names never touch DuckDB.
+        self._alias_index: Dict[str, List[Tuple[date, Optional[date], int]]] = {}
+        # Entity IDs drawn from the sequence ahead of time, consumed from the end
+        self._reserved_ids: List[int] = []
+        self._in_batch = False
         self._init_db()
-        self._cache: Dict[str, int] = {}
+        self._warm_alias_index()
 
     def _init_db(self) -> None:
         if self.path == ":memory:":
@@ -30,7 +103,7 @@ class IdentityRegistry:
                 alias VARCHAR,
                 entity_id INTEGER,
                 valid_from DATE,
-                valid_to DATE,
+                valid_to DATE DEFAULT DATE '9999-12-31',
                 PRIMARY KEY (alias, valid_from)
             );
             
@@ -53,99 +126,212 @@ class IdentityRegistry:
                 first_innings_runs INTEGER,
                 first_innings_count INTEGER
             );
+
+            -- Point lookups on alias; the (alias, valid_from) key alone is not used for them
+            CREATE INDEX IF NOT EXISTS aliases_alias_idx ON aliases(alias);
+        """)
+        self._migrate_open_ended_aliases()
+
+    def _migrate_open_ended_aliases(self) -> None:
+        """
+        One-time upgrade of registries created before valid_to had a default:
+        NULL valid_to becomes the open-ended sentinel.
+        """
+        if self.con.execute(_VALID_TO_DEFAULT_SQL).fetchone()[0] is not None:
+            return
+        self.con.execute("""
+            UPDATE aliases SET valid_to = DATE '9999-12-31' WHERE valid_to IS NULL;
+            ALTER TABLE aliases ALTER COLUMN valid_to SET DEFAULT DATE '9999-12-31';
         """)
 
+    def _warm_alias_index(self) -> None:
+        """Loads every alias validity window into memory in one scan."""
+        rows = self.con.execute("SELECT alias, entity_id, valid_from, valid_to FROM aliases").fetchall()
+        for alias, entity_id, valid_from, valid_to in rows:
+            self._alias_index.setdefault(alias, []).append((valid_from, valid_to, entity_id))
+
+    def _remember(self, cache_key: Tuple[str, str, date], entity_id: int) -> None:
+        self._cache[cache_key] = entity_id
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+
+    def _lookup_alias_index(self, name: str, match_date: date) -> Optional[int]:
+        for valid_from, valid_to, entity_id in self._alias_index.get(name, ()):
+            if valid_from <= match_date and (valid_to is None or valid_to >= match_date):
+                return entity_id
+        return None
+
+    @contextmanager
+    def batch(self) -> Iterator["IdentityRegistry"]:
+        """
+        Groups writes into one transaction instead of autocommitting every
+        auto-ingest INSERT. Nested calls join the outer batch.
+        """
+        if self._in_batch:
+            yield self
+            return
+
+        self.con.begin()
+        self._in_batch = True
+        try:
+            yield self
+        except Exception:
+            self.con.rollback()
+            self._reset_memory_state()
+            raise
+        else:
+            self.con.commit()
+        finally:
+            self._in_batch = False
+
+    def flush(self) -> None:
+        """Commits pending batch writes and keeps the batch open."""
+        if self._in_batch:
+            self.con.commit()
+            self.con.begin()
+
+    def _reset_memory_state(self) -> None:
+        """Drops in-memory state that may reference rolled-back rows."""
+        self._cache.clear()
+        self._alias_index.clear()
+        self._reserved_ids.clear()
+        self._warm_alias_index()
+
+    def _alloc_id(self) -> int:
+        """Hands out the next entity ID, refilling a block from the sequence."""
+        if not self._reserved_ids:
+            rows = self.con.execute(_RESERVE_IDS_SQL, [_ID_BLOCK_SIZE]).fetchall()
+            if not rows:
+                raise RuntimeError("Failed to generate entity ID")
+            self._reserved_ids = sorted((cast(int, r[0]) for r in rows), reverse=True)
+        return self._reserved_ids.pop()
+
     def get_player_stats(self, player_id: int) -> Optional[Dict[str, Any]]:
-        res = self.con.execute("SELECT * FROM player_stats WHERE entity_id = ?", [player_id]).fetchone()
+        res = self.con.execute(
+            "SELECT matches, runs, balls_faced, wickets, balls_bowled, runs_conceded FROM player_stats WHERE entity_id = ?",
+            [player_id]
+        ).fetchone()
         if res:
             return {
-                "matches": res[1],
-                "runs": res[2],
-                "balls_faced": res[3],
-                "wickets": res[4],
-                "balls_bowled": res[5],
-                "runs_conceded": res[6]
+                "matches": res[0],
+                "runs": res[1],
+                "balls_faced": res[2],
+                "wickets": res[3],
+                "balls_bowled": res[4],
+                "runs_conceded": res[5]
             }
         return None
 
+    def get_player_stats_batch(self, player_ids: List[int]) -> pa.Table:
+        """Fetches stats for many players in one join against an Arrow id list."""
+        self.con.register('ids_view', pa.table({"id": pa.array(player_ids, pa.int32())}))
+        try:
+            result = self.con.execute("""
+                SELECT s.entity_id, s.matches, s.runs, s.balls_faced, s.wickets, s.balls_bowled, s.runs_conceded
+                FROM player_stats s
+                JOIN ids_view i ON s.entity_id = i.id
+            """).arrow()
+            # Materialize before the view goes away; .arrow() may return a lazy reader
+            if isinstance(result, pa.RecordBatchReader):
+                result = result.read_all()
+        finally:
+            self.con.unregister('ids_view')
+        return result
+
     def get_venue_stats(self, venue_id: int) -> Optional[Dict[str, Any]]:
-        res = self.con.execute("SELECT * FROM venue_stats WHERE entity_id = ?", [venue_id]).fetchone()
+        res = self.con.execute(
+            "SELECT matches, total_runs, first_innings_runs, first_innings_count FROM venue_stats WHERE entity_id = ?",
+            [venue_id]
+        ).fetchone()
         if res:
             return {
-                "matches": res[1],
-                "total_runs": res[2],
-                "avg_first_innings": res[3] / res[4] if res[4] > 0 else 0
+                "matches": res[0],
+                "total_runs": res[1],
+                "avg_first_innings": res[2] / res[3] if res[3] > 0 else 0
             }
         return None
 
     def upsert_player_stats(self, stats: Dict[int, Dict[str, int]]) -> None:
         """Bulk upsert player stats."""
-        # DuckDB doesn't have a simple UPSERT for batch, so we'll delete and insert
-        # In a real high-concurrency app, this would be a transaction.
-        ids = list(stats.keys())
-        if not ids:
+        if not stats:
             return
-            
-        self.con.execute(f"DELETE FROM player_stats WHERE entity_id IN ({','.join(map(str, ids))})")
-        
-        data = []
-        for pid, s in stats.items():
-            data.append((pid, s['matches'], s['runs'], s['balls_faced'], s['wickets'], s['balls_bowled'], s['runs_conceded']))
-            
-        self.con.executemany("INSERT INTO player_stats VALUES (?, ?, ?, ?, ?, ?, ?)", data)
+
+        rows = list(stats.values())
+        table = pa.table({
+            "entity_id": pa.array(list(stats.keys()), pa.int32()),
+            "matches": pa.array([s['matches'] for s in rows], pa.int32()),
+            "runs": pa.array([s['runs'] for s in rows], pa.int32()),
+            "balls_faced": pa.array([s['balls_faced'] for s in rows], pa.int32()),
+            "wickets": pa.array([s['wickets'] for s in rows], pa.int32()),
+            "balls_bowled": pa.array([s['balls_bowled'] for s in rows], pa.int32()),
+            "runs_conceded": pa.array([s['runs_conceded'] for s in rows], pa.int32()),
+        })
+        self._upsert_from_arrow(_UPSERT_PLAYER_STATS_SQL, table)
 
     def upsert_venue_stats(self, stats: Dict[int, Dict[str, int]]) -> None:
         """Bulk upsert venue stats."""
-        ids = list(stats.keys())
-        if not ids:
+        if not stats:
             return
 
-        self.con.execute(f"DELETE FROM venue_stats WHERE entity_id IN ({','.join(map(str, ids))})")
-        
-        data = []
-        for vid, s in stats.items():
-            data.append((vid, s['matches'], s['total_runs'], s['first_innings_runs'], s['first_innings_count']))
-            
-        self.con.executemany("INSERT INTO venue_stats VALUES (?, ?, ?, ?, ?)", data)
+        rows = list(stats.values())
+        table = pa.table({
+            "entity_id": pa.array(list(stats.keys()), pa.int32()),
+            "matches": pa.array([s['matches'] for s in rows], pa.int32()),
+            "total_runs": pa.array([s['total_runs'] for s in rows], pa.int32()),
+            "first_innings_runs": pa.array([s['first_innings_runs'] for s in rows], pa.int32()),
+            "first_innings_count": pa.array([s['first_innings_count'] for s in rows], pa.int32()),
+        })
+        self._upsert_from_arrow(_UPSERT_VENUE_STATS_SQL, table)
 
+    def _upsert_from_arrow(self, sql: str, table: pa.Table) -> None:
+        """Runs a single ON CONFLICT upsert over a registered Arrow table."""
+        self.con.register('upsert_view', table)
+        try:
+            with self.batch():
+                self.con.execute(sql)
+        finally:
+            self.con.unregister('upsert_view')
 
     def _resolve_generic(self, name: str, entity_type: str, match_date: date, auto_ingest: bool = False) -> int:
-        prefix = entity_type[0].upper()
-        cache_key = f"{prefix}:{name}:{match_date}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        # Check Aliases
-        res = self.con.execute("""
-            SELECT entity_id 
-            FROM aliases 
-            WHERE alias = ? 
-              AND valid_from <= ? 
-              AND (valid_to IS NULL OR valid_to >= ?)
-        """, [name, match_date, match_date]).fetchone()
+        cache_key = (entity_type, name, match_date)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
+
+        # Check Aliases (preloaded index first, then DuckDB for rows added since)
+        known_id = self._lookup_alias_index(name, match_date)
+        if known_id is not None:
+            self._remember(cache_key, known_id)
+            return known_id
+
+        if auto_ingest:
+            # One statement both checks for a covering alias and claims the
+            # name; the entity row only follows when the alias was inserted.
+            entity_id = self._alloc_id()
+            with self.batch():
+                inserted = self.con.execute(
+                    _INSERT_ALIAS_IF_ABSENT_SQL, [name, entity_id, match_date]
+                ).fetchone()
+                if inserted:
+                    self.con.execute(_INSERT_ENTITY_SQL, [entity_id, entity_type, name])
+            if inserted:
+                self._alias_index.setdefault(name, []).append((match_date, _OPEN_ENDED, entity_id))
+                self._remember(cache_key, entity_id)
+                return entity_id
+            # Someone else registered the alias; give the ID back and look it up
+            self._reserved_ids.append(entity_id)
+
+        res = self.con.execute(_ALIAS_LOOKUP_SQL, [name, match_date]).fetchone()
+        if res is None:
+            res = self.con.execute(_OPEN_ALIAS_LOOKUP_SQL, [name, match_date]).fetchone()
 
         if res:
             entity_id = cast(int, res[0])
-            self._cache[cache_key] = entity_id
+            self._remember(cache_key, entity_id)
             return entity_id
 
-        if not auto_ingest:
-            raise EntityNotFoundError(f"Entity '{name}' of type '{entity_type}' not found for date {match_date}")
-
-        # Auto-Ingest
-        res_seq = self.con.execute("SELECT nextval('entity_id_seq')").fetchone()
-        if not res_seq:
-            raise RuntimeError("Failed to generate entity ID")
-        entity_id = cast(int, res_seq[0])
-        
-        self.con.execute("INSERT INTO entities VALUES (?, ?, ?)", [entity_id, entity_type, name])
-        self.con.execute("""
-            INSERT INTO aliases (alias, entity_id, valid_from, valid_to)
-            VALUES (?, ?, ?, NULL)
-        """, [name, entity_id, match_date])
-        
-        self._cache[cache_key] = entity_id
-        return entity_id
+        raise EntityNotFoundError(f"Entity '{name}' of type '{entity_type}' not found for date {match_date}")
 
     def resolve_player(self, name: str, match_date: Optional[date] = None, auto_ingest: bool = False) -> int:
         if match_date is None:
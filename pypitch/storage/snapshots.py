@@ -1,20 +1,33 @@
 import json
+import os
 import time
 from pathlib import Path
-from typing import List, Dict, Any, cast
+from typing import List, Dict, Any
+
+# Faster serializer when available (conditional import)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
 
 class SnapshotManager:
     def __init__(self, data_dir: str):
         self.meta_path = Path(data_dir) / "snapshots.json"
         self.history: Dict[str, List[Dict[str, Any]]] = {"snapshots": []}
+        self._latest_id = "initial"
         self._load()
 
     def _load(self) -> None:
+        """Reads snapshots.json once; self.history is authoritative afterwards."""
         if self.meta_path.exists():
-            with open(self.meta_path, 'r') as f:
-                self.history = json.load(f)
+            raw = self.meta_path.read_bytes()
+            self.history = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
         else:
             self.history = {"snapshots": []}
+        snapshots = self.history["snapshots"]
+        self._latest_id = str(snapshots[-1]["id"]) if snapshots else "initial"
 
     def create_snapshot(self, tag: str, description: str = "") -> None:
         """Records a new immutable state of the database."""
@@ -25,13 +38,20 @@ class SnapshotManager:
             "schema_version": "1.0.0"
         }
         self.history["snapshots"].append(snapshot)
+        self._latest_id = str(tag)
         self._save()
 
     def _save(self) -> None:
-        with open(self.meta_path, 'w') as f:
-            json.dump(self.history, f, indent=2)
+        """Writes to a temp file and swaps it in, so a crash never leaves a torn file."""
+        # Compact output: the history is machine-read, and indentation would
+        # roughly double the bytes rewritten on every snapshot
+        if HAS_ORJSON:
+            payload = orjson.dumps(self.history)
+        else:
+            payload = json.dumps(self.history, separators=(",", ":")).encode("utf-8")
+        tmp_path = self.meta_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, self.meta_path)
 
     def get_latest(self) -> str:
-        if not self.history["snapshots"]:
-            return "initial"
-        return str(self.history["snapshots"][-1]["id"])
+        return self._latest_id
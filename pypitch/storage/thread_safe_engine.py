@@ -1,38 +1,103 @@
 """
 Thread-Safe Query Engine with Connection Pooling
 
-Addresses concurrency issues by providing separate read/write connections
-and managing them safely across multiple threads.
+Addresses concurrency issues by providing a pool of read connections and a
+single writer thread that applies writes in FIFO order.
 """
 
+import asyncio
+import logging
 import duckdb
 import pyarrow as pa
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Any, Optional, List
 import threading
 import queue
 import time
+import warnings
 from contextlib import contextmanager
 
-from .engine import QueryEngine
+from .engine import QueryEngine, _TABLE_EXISTS_SQL
 from ..exceptions import ConnectionError, QueryTimeoutError
 
+logger = logging.getLogger(__name__)
+
+# Columns written by insert_live_delivery, in buffer-tuple order
+_LIVE_DELIVERY_SCHEMA = pa.schema([
+    ('match_id', pa.string()),
+    ('inning', pa.int32()),
+    ('over', pa.int32()),
+    ('ball', pa.int32()),
+    ('runs_total', pa.int32()),
+    ('wickets_fallen', pa.int32()),
+    ('target', pa.int32()),
+    ('venue', pa.string()),
+    ('timestamp', pa.float64()),
+])
+
+_INT32_MIN, _INT32_MAX = -2 ** 31, 2 ** 31 - 1
+
+def _live_int(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    value = int(value)
+    if not _INT32_MIN <= value <= _INT32_MAX:
+        raise ValueError(f"{value} is out of range for INTEGER")
+    return value
+
+def _live_str(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+def _live_float(value: Any) -> Optional[float]:
+    return None if value is None else float(value)
+
+# Tables created on startup when absent, by name
+_REQUIRED_TABLES = {
+    'ball_events': """
+        CREATE TABLE ball_events (
+            match_id VARCHAR,
+            inning INTEGER,
+            over INTEGER,
+            ball INTEGER,
+            runs_total INTEGER,
+            wickets_fallen INTEGER,
+            target INTEGER,
+            venue VARCHAR,
+            timestamp DOUBLE
+        )
+    """,
+}
+
 class ConnectionPool:
     """
     Thread-safe connection pool for DuckDB.
 
-    Maintains separate pools for read and write operations.
+    Maintains a pool of read connections. Writes are submitted as callables
+    to one writer thread that owns the only write connection, matching
+    DuckDB's single-writer model and serving writers strictly first-come,
+    first-served.
     """
 
     def __init__(self, db_path: str = ":memory:", max_connections: int = 10,
-                 read_pool_size: int = 5, write_pool_size: int = 2):
+                 read_pool_size: int = 5, write_pool_size: int = 1):
         self.db_path = db_path
         self.max_connections = max_connections
         self.read_pool_size = read_pool_size
-        self.write_pool_size = write_pool_size
+        # Kept for configuration compatibility; there is always one writer
+        if write_pool_size != 1:
+            warnings.warn(
+                f"write_pool_size={write_pool_size} is ignored and deprecated; "
+                "ConnectionPool always applies writes on a single writer thread",
+                DeprecationWarning,
+                stacklevel=2
+            )
+        self.write_pool_size = 1
 
         # Connection pools
-        self.read_pool: queue.Queue = queue.Queue(maxsize=read_pool_size)
-        self.write_pool: queue.Queue = queue.Queue(maxsize=write_pool_size)
+        # LIFO: the most recently returned (warmest) read connection is reused first
+        self.read_pool: queue.LifoQueue = queue.LifoQueue(maxsize=read_pool_size)
+        self._write_tasks: queue.SimpleQueue = queue.SimpleQueue()
 
         # Pool management
         self._lock = threading.RLock()
@@ -41,6 +106,9 @@ class ConnectionPool:
         # Initialize pools
         self._initialize_pools()
 
+        self._writer = threading.Thread(target=self._writer_loop, name="pypitch-writer", daemon=True)
+        self._writer.start()
+
     def _initialize_pools(self):
         """Initialize connection pools."""
         # For file-based databases, we need to create the database first with a write connection
@@ -61,25 +129,37 @@ class ConnectionPool:
                     temp_conn = duckdb.connect(self.db_path)
                     temp_conn.close()
 
+        # One database handle; every pooled connection is a cursor on it, so
+        # they share the catalog, buffer pool and settings (and, for
+        # ":memory:", the same database rather than one each).
+        self._base_conn = duckdb.connect(self.db_path)
+        self._base_conn.execute("PRAGMA threads=2;")
+        self._base_conn.execute("PRAGMA memory_limit='1GB';")
+
         # Create read connections
         for _ in range(self.read_pool_size):
-            conn = self._create_connection(read_only=True)
-            self.read_pool.put(conn)
-
-        # Create write connections
-        for _ in range(self.write_pool_size):
-            conn = self._create_connection(read_only=False)
-            self.write_pool.put(conn)
+            self.read_pool.put(self._create_read_connection())
+
+        # Connection owned by the writer thread
+        self._write_conn = self._create_write_connection()
+
+    def _create_read_connection(self) -> duckdb.DuckDBPyConnection:
+        """Create a cursor tuned for analytic reads."""
+        conn = self._create_connection()
+        # Session-scoped: unordered results materialize in parallel, and
+        # Parquet metadata stays cached across queries.
+        conn.execute("SET SESSION preserve_insertion_order=false")
+        conn.execute("SET SESSION enable_object_cache=true")
+        return conn
 
-    def _create_connection(self, read_only: bool = False) -> duckdb.DuckDBPyConnection:
-        """Create a new DuckDB connection with appropriate settings."""
-        # Always create read-write connections to avoid configuration conflicts
-        # We manage read/write separation via the pools
-        conn = duckdb.connect(self.db_path, read_only=False)
+    def _create_write_connection(self) -> duckdb.DuckDBPyConnection:
+        """Create the writer's cursor; insertion order is kept so written
+        tables and files stay in ingest order."""
+        return self._create_connection()
 
-        # Performance tuning
-        conn.execute("PRAGMA threads=2;")  # Reduced for connection pooling
-        conn.execute("PRAGMA memory_limit='1GB';")
+    def _create_connection(self) -> duckdb.DuckDBPyConnection:
+        """Create a new cursor on the shared database handle."""
+        conn = self._base_conn.cursor()
 
         with self._lock:
             self._created_connections += 1
@@ -103,28 +183,41 @@ class ConnectionPool:
                     # Pool is full, close this connection
                     conn.close()
 
-    @contextmanager
-    def get_write_connection(self, timeout: float = 5.0):
-        """Get a write connection from the pool."""
-        conn = None
-        try:
-            conn = self.write_pool.get(timeout=timeout)
-            yield conn
-        except queue.Empty:
-            raise ConnectionError("No write connections available (pool exhausted)")
-        finally:
-            if conn:
-                try:
-                    self.write_pool.put(conn, timeout=1.0)
-                except queue.Full:
-                    # Pool is full, close this connection
-                    conn.close()
+    def _writer_loop(self) -> None:
+        """Apply queued write tasks one at a time until the stop sentinel."""
+        while True:
+            task = self._write_tasks.get()
+            if task is None:
+                return
+            fn, future = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(self._write_conn))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def submit_write(self, fn: Callable[[duckdb.DuckDBPyConnection], Any]) -> Future:
+        """Queue fn(write_connection) on the writer thread."""
+        future: Future = Future()
+        self._write_tasks.put((fn, future))
+        return future
+
+    def run_write(self, fn: Callable[[duckdb.DuckDBPyConnection], Any],
+                  timeout: Optional[float] = None) -> Any:
+        """Run fn on the writer thread and wait for its result."""
+        return self.submit_write(fn).result(timeout=timeout)
+
+    async def run_write_async(self, fn: Callable[[duckdb.DuckDBPyConnection], Any]) -> Any:
+        """Await fn on the writer thread without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit_write(fn))
 
     def get_pool_stats(self) -> Dict[str, Any]:
         """Get connection pool statistics."""
         return {
             'read_pool_size': self.read_pool.qsize(),
-            'write_pool_size': self.write_pool.qsize(),
+            'write_pool_size': self.write_pool_size,
+            'pending_writes': self._write_tasks.qsize(),
             'total_created': self._created_connections,
             'max_connections': self.max_connections
         }
@@ -139,13 +232,12 @@ class ConnectionPool:
             except queue.Empty:
                 break
 
-        # Close write connections
-        while not self.write_pool.empty():
-            try:
-                conn = self.write_pool.get_nowait()
-                conn.close()
-            except queue.Empty:
-                break
+        # Drain queued writes, then stop the writer and close its connection
+        if self._writer.is_alive():
+            self._write_tasks.put(None)
+            self._writer.join()
+            self._write_conn.close()
+            self._base_conn.close()
 
 class ThreadSafeQueryEngine:
     """
@@ -166,26 +258,47 @@ class ThreadSafeQueryEngine:
         self._derived_versions: Dict[str, str] = {}
         self._state_lock = threading.RLock()
 
+        # Tables known to exist; skips the catalog probe before every write
+        self._known_tables: set = set()
+
+        # LRU of read results keyed by (sql, params, write version), used by
+        # reads that pass cache=True. The
+        # DuckDB Python client has no prepared-statement handle to reuse, so
+        # repeated dashboard reads skip parse, plan and execution here instead.
+        self.result_cache_size = 128
+        self._result_cache: OrderedDict = OrderedDict()
+        self._write_version = 0
+
+        # Live deliveries are buffered and written as one Arrow batch, at
+        # live_flush_rows or every live_flush_interval seconds
+        self.live_flush_rows = 2048
+        self.live_flush_interval = 0.1
+        self._live_buffer: List[tuple] = []
+        self._live_buffer_lock = threading.Lock()
+        self._live_flusher: Optional[threading.Thread] = None
+        self._live_stop = threading.Event()
+        # Set when a background flush fails; raised to the next producer
+        self._live_error: Optional[BaseException] = None
+
         # Initialize database schema if needed
         self._ensure_schema()
 
     def _ensure_schema(self):
         """Ensure basic schema exists."""
-        with self.pool.get_write_connection() as conn:
-            # Create basic tables if they don't exist
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS ball_events (
-                    match_id VARCHAR,
-                    inning INTEGER,
-                    over INTEGER,
-                    ball INTEGER,
-                    runs_total INTEGER,
-                    wickets_fallen INTEGER,
-                    target INTEGER,
-                    venue VARCHAR,
-                    timestamp DOUBLE
-                )
-            """)
+        def create(conn):
+            # One catalog scan, then create only the tables that are missing
+            existing = {
+                row[0] for row in
+                conn.execute("SELECT table_name FROM information_schema.tables").fetchall()
+            }
+            for name, ddl in _REQUIRED_TABLES.items():
+                if name not in existing:
+                    conn.execute(ddl)
+            return existing | _REQUIRED_TABLES.keys()
+
+        tables = self.pool.run_write(create)
+        with self._state_lock:
+            self._known_tables.update(tables)
 
     @property
     def snapshot_id(self) -> str:
@@ -202,18 +315,25 @@ class ThreadSafeQueryEngine:
         Thread-safe ingestion of events.
         Write operations are serialized through the connection pool.
         """
-        with self.pool.get_write_connection() as conn:
+        self._flush_live()
+
+        def write(conn):
             # Register the Arrow table
             conn.register('arrow_view', arrow_table)
 
             try:
                 exists = self._table_exists_conn(conn, "ball_events")
 
-                # Persist to disk
+                # Persist to disk. One statement per table: DuckDB already
+                # writes large inserts straight to row groups, so splitting
+                # into per-batch INSERTs only adds statement overhead.
                 if append and exists:
                     conn.execute("INSERT INTO ball_events SELECT * FROM arrow_view")
                 else:
                     conn.execute("CREATE OR REPLACE TABLE ball_events AS SELECT * FROM arrow_view")
+                    with self._state_lock:
+                        self._known_tables.add("ball_events")
+                self._bump_write_version()
 
             finally:
                 try:
@@ -221,6 +341,8 @@ class ThreadSafeQueryEngine:
                 except Exception:
                     pass
 
+        self.pool.run_write(write)
+
         with self._state_lock:
             self._snapshot_id = snapshot_tag
 
@@ -228,30 +350,110 @@ class ThreadSafeQueryEngine:
         """
         Insert live delivery data.
 
+        Rows are buffered and written in batches of live_flush_rows, or by a
+        background flush every live_flush_interval seconds; every read path
+        flushes first, so buffered deliveries are always visible.
+
         Args:
             delivery_data: Dictionary with delivery information
         """
-        with self.pool.get_write_connection() as conn:
-            # Insert the delivery
-            conn.execute("""
-                INSERT INTO ball_events (
-                    match_id, inning, over, ball, runs_total,
-                    wickets_fallen, target, venue, timestamp
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
-                delivery_data['match_id'],
-                delivery_data['inning'],
-                delivery_data['over'],
-                delivery_data['ball'],
-                delivery_data['runs_total'],
-                delivery_data['wickets_fallen'],
-                delivery_data.get('target'),
-                delivery_data.get('venue'),
-                delivery_data.get('timestamp', time.time())
-            ])
+        self._raise_live_error()
+
+        # Coerced here so a malformed delivery fails for its own caller
+        # instead of the batch it would have been flushed with
+        row = (
+            _live_str(delivery_data['match_id']),
+            _live_int(delivery_data['inning']),
+            _live_int(delivery_data['over']),
+            _live_int(delivery_data['ball']),
+            _live_int(delivery_data['runs_total']),
+            _live_int(delivery_data['wickets_fallen']),
+            _live_int(delivery_data.get('target')),
+            _live_str(delivery_data.get('venue')),
+            _live_float(delivery_data.get('timestamp', time.time()))
+        )
+        with self._live_buffer_lock:
+            self._live_buffer.append(row)
+            full = len(self._live_buffer) >= self.live_flush_rows
+            if self._live_flusher is None:
+                self._live_flusher = threading.Thread(
+                    target=self._live_flush_loop, name="pypitch-live-flush", daemon=True
+                )
+                self._live_flusher.start()
+        if full:
+            self._flush_live()
+
+    def _live_flush_loop(self) -> None:
+        """Flush buffered deliveries on a timer until the engine closes."""
+        while not self._live_stop.wait(self.live_flush_interval):
+            try:
+                self._flush_live()
+            except Exception as e:
+                # The rows stay buffered for the next flush; producers see
+                # the error on their next insert_live_delivery or flush_live
+                logger.warning("Background live flush failed: %s", e)
+                with self._live_buffer_lock:
+                    self._live_error = e
+
+    def _raise_live_error(self) -> None:
+        """Raise, once, the error from a failed background flush."""
+        with self._live_buffer_lock:
+            error, self._live_error = self._live_error, None
+        if error is not None:
+            raise error
+
+    def flush_live(self) -> None:
+        """
+        Write buffered live deliveries to ball_events.
+
+        Raises a pending background flush error first, if there is one.
+        """
+        self._raise_live_error()
+        self._flush_live()
+
+    def _flush_live(self) -> None:
+        """
+        Write buffered live deliveries to ball_events in one INSERT.
+
+        If the write fails the rows go back to the front of the buffer and
+        the error propagates.
+        """
+        def write(conn):
+            conn.register('live_view', batch)
+            try:
+                conn.execute(f"""
+                    INSERT INTO ball_events ({', '.join(_LIVE_DELIVERY_SCHEMA.names)})
+                    SELECT * FROM live_view
+                """)
+                self._bump_write_version()
+            finally:
+                try:
+                    conn.unregister('live_view')
+                except Exception:
+                    pass
+
+        with self._live_buffer_lock:
+            if not self._live_buffer:
+                return
+            rows = self._live_buffer
+            columns = list(zip(*rows))
+            batch = pa.Table.from_arrays(
+                [pa.array(col, type=field.type) for col, field in zip(columns, _LIVE_DELIVERY_SCHEMA)],
+                schema=_LIVE_DELIVERY_SCHEMA
+            )
+            self._live_buffer = []
+            # Queued under the lock so concurrent flushes reach the writer in buffer order
+            future = self.pool.submit_write(write)
+
+        try:
+            future.result()
+        except BaseException:
+            with self._live_buffer_lock:
+                self._live_buffer[:0] = rows
+            raise
 
     def execute_sql(self, sql: str, params: Optional[list] = None,
-                   read_only: bool = True, timeout: float = 30.0) -> pa.Table:
+                   read_only: bool = True, timeout: float = 30.0, cache: bool = False) -> pa.Table:
         """
         Execute SQL with connection pooling.
 
@@ -260,30 +462,78 @@ class ThreadSafeQueryEngine:
             params: Query parameters
             read_only: Whether this is a read-only query
             timeout: Query timeout in seconds
+            cache: Serve a repeated read from the result cache until the
+                next write; leave off for probes and ad-hoc SQL
         """
         if params is None:
             params = []
 
+        self._flush_live()
         start_time = time.time()
 
+        key = self._result_cache_key(sql, params) if read_only and cache else None
+        if key is not None:
+            with self._state_lock:
+                cached = self._result_cache.get(key)
+                if cached is not None:
+                    self._result_cache.move_to_end(key)
+                    return cached
+
         try:
             if read_only:
                 with self.pool.get_read_connection(timeout=5.0) as conn:
                     result = conn.execute(sql, params).arrow()
+                    # Materialize before the cursor goes back to the pool
+                    if isinstance(result, pa.RecordBatchReader):
+                        result = result.read_all()
             else:
-                with self.pool.get_write_connection(timeout=5.0) as conn:
-                    result = conn.execute(sql, params).arrow()
-
-            # Ensure we return a Table
-            if isinstance(result, pa.RecordBatchReader):
-                return result.read_all()
-            return result
+                def write(conn):
+                    # Arbitrary DDL may drop tables; re-probe afterwards
+                    with self._state_lock:
+                        self._known_tables.clear()
+                    try:
+                        result = conn.execute(sql, params).arrow()
+                        if isinstance(result, pa.RecordBatchReader):
+                            return result.read_all()
+                        return result
+                    finally:
+                        # On the writer thread, so cached reads are dropped
+                        # even if the caller stopped waiting on a timeout
+                        self._bump_write_version()
+                result = self.pool.run_write(write, timeout=timeout)
 
         except Exception as e:
             if time.time() - start_time > timeout:
                 raise QueryTimeoutError(f"Query timed out after {timeout}s: {sql}")
             raise e
 
+        if key is not None:
+            with self._state_lock:
+                self._result_cache[key] = result
+                if len(self._result_cache) > self.result_cache_size:
+                    self._result_cache.popitem(last=False)
+        return result
+
+    def _result_cache_key(self, sql: str, params: list) -> Optional[tuple]:
+        """Cache key for a read query, or None if it should not be cached."""
+        if self.result_cache_size <= 0:
+            return None
+        head = sql.lstrip()[:6].upper()
+        if not (head.startswith("SELECT") or head.startswith("WITH")):
+            return None
+        with self._state_lock:
+            key = (sql, tuple(params), self._write_version)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _bump_write_version(self) -> None:
+        with self._state_lock:
+            self._write_version += 1
+            self._result_cache.clear()
+
     def run(self, plan: Dict[str, Any]) -> pa.Table:
         """Execute a query plan."""
         if "sql" in plan:
@@ -292,27 +542,37 @@ class ThreadSafeQueryEngine:
 
     def table_exists(self, table_name: str) -> bool:
         """Check if a table exists."""
+        self._flush_live()
         with self.pool.get_read_connection() as conn:
             return self._table_exists_conn(conn, table_name)
 
     def _table_exists_conn(self, conn, table_name: str) -> bool:
         """Check table existence using a specific connection."""
+        with self._state_lock:
+            if table_name in self._known_tables:
+                return True
         try:
-            res = conn.execute(
-                "SELECT count(*) FROM information_schema.tables WHERE table_name = ?",
-                [table_name]
-            ).fetchone()
-            return res[0] > 0 if res else False
+            exists = conn.execute(_TABLE_EXISTS_SQL, [table_name]).fetchone() is not None
         except Exception:
             return False
+        if exists:
+            with self._state_lock:
+                self._known_tables.add(table_name)
+        return exists
 
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get connection pool statistics."""
         return self.pool.get_pool_stats()
 
     def close(self) -> None:
-        """Close all connections."""
-        self.pool.close()
+        """Flush buffered deliveries and close all connections."""
+        self._live_stop.set()
+        try:
+            if self._live_flusher is not None:
+                self._live_flusher.join()
+            self._flush_live()
+        finally:
+            self.pool.close()
 
 # Factory function for backward compatibility
 def create_thread_safe_engine(db_path: str = ":memory:",
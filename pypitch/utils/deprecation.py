@@ -1,3 +1,4 @@
+import functools
 import warnings
 from typing import Any
 
@@ -11,12 +12,19 @@ def deprecated_function(message: str, version: str):
             pass
     """
     def decorator(func):
+        warned = False
+
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            warnings.warn(
-                f"{func.__name__} is deprecated and will be removed in v{version}. {message}",
-                DeprecationWarning,
-                stacklevel=2
-            )
+            # Warn on the first call only; later calls skip the warnings machinery
+            nonlocal warned
+            if not warned:
+                warned = True
+                warnings.warn(
+                    f"{func.__name__} is deprecated and will be removed in v{version}. {message}",
+                    DeprecationWarning,
+                    stacklevel=2
+                )
             return func(*args, **kwargs)
         return wrapper
     return decorator
@@ -32,8 +40,13 @@ def deprecated_argument(arg_name: str, message: str, version: str):
                 warnings.warn(...)
     """
     def decorator(func):
+        warned = False
+
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            if arg_name in kwargs and kwargs[arg_name] is not None:
+            nonlocal warned
+            if not warned and kwargs.get(arg_name) is not None:
+                warned = True
                 warnings.warn(
                     f"Argument '{arg_name}' is deprecated and will be removed in v{version}. {message}",
                     DeprecationWarning,
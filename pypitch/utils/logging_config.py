@@ -2,12 +2,17 @@
 Logging configuration for PyPitch.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Drains queued records to the log file on a background thread
+_file_listener: Optional[logging.handlers.QueueListener] = None
+
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     """
     Setup comprehensive logging for PyPitch.
@@ -16,6 +21,9 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
     """
+    global _file_listener
+    debug = level.upper() == "DEBUG"
+
     # Create logger
     logger = logging.getLogger("pypitch")
     logger.setLevel(getattr(logging, level.upper()))
@@ -23,6 +31,11 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     # Remove existing handlers
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
 
     # Create formatters
     detailed_formatter = logging.Formatter(
@@ -47,8 +60,13 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
             log_path, maxBytes=10*1024*1024, backupCount=5
         )
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(detailed_formatter if debug else simple_formatter)
+
+        # Callers only enqueue; file writes and rotation happen off-thread
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _file_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        _file_listener.start()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     # Set logging for all pypitch modules
     logging.getLogger("pypitch").setLevel(getattr(logging, level.upper()))
@@ -58,6 +76,13 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     logging.getLogger("requests").setLevel(logging.WARNING)
     logging.getLogger("duckdb").setLevel(logging.WARNING)
 
+def _stop_file_listener() -> None:
+    """Flush queued records to the log file at interpreter exit."""
+    if _file_listener is not None:
+        _file_listener.stop()
+
+atexit.register(_stop_file_listener)
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger for a specific module."""
     return logging.getLogger(f"pypitch.{name}")
\ No newline at end of file
@@ -14,14 +14,19 @@ def migrate_schema(parquet_path: str, latest_schema: pa.Schema):
     if not os.path.exists(parquet_path):
         print(f"[SchemaMigration] File not found: {parquet_path}")
         return
-    table = pq.read_table(parquet_path)
-    current_schema = table.schema
-    missing = [f for f in latest_schema.names if f not in current_schema.names]
+    # Diff against the footer schema; the data is only read if columns are missing
+    meta = pq.read_metadata(parquet_path)
+    current_names = set(meta.schema.to_arrow_schema().names)
+    missing = [f for f in latest_schema.names if f not in current_names]
     if not missing:
         print(f"[SchemaMigration] {parquet_path} is up to date.")
         return
-    # Add missing columns with nulls
-    for col in missing:
-        table = table.append_column(col, pa.array([None] * table.num_rows, type=latest_schema.field(col).type))
-    pq.write_table(table, parquet_path)
+    table = pq.read_table(parquet_path)
+    # Add all missing columns as typed null arrays in a single table rebuild
+    new_arrays = list(table.columns) + [
+        pa.nulls(table.num_rows, type=latest_schema.field(col).type) for col in missing
+    ]
+    table = pa.Table.from_arrays(new_arrays, names=table.column_names + missing)
+    pq.write_table(table, parquet_path, compression="zstd", use_dictionary=True,
+                   data_page_size=1 << 20)
     print(f"[SchemaMigration] Migrated {parquet_path} to latest schema.")
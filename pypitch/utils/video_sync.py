@@ -4,9 +4,31 @@ Maps ball_index to video timestamp for easy video analysis.
 """
 from typing import Optional
 
+import numpy as np
+
 def get_video_timestamp(ball_index: int, mapping: dict) -> Optional[int]:
     """
     Returns the video timestamp (in seconds) for a given ball_index.
     mapping: dict of {ball_index: timestamp}
     """
     return mapping.get(ball_index)
+
+def build_mapping_array(mapping: dict) -> np.ndarray:
+    """
+    Converts a {ball_index: timestamp} mapping into a dense int32 array.
+    arr[ball_index] is the timestamp in seconds, or -1 where none is mapped.
+    """
+    arr = np.full(max(mapping, default=0) + 1, -1, dtype=np.int32)
+    arr[np.fromiter(mapping.keys(), dtype=np.intp, count=len(mapping))] = \
+        np.fromiter(mapping.values(), dtype=np.int32, count=len(mapping))
+    return arr
+
+def get_video_timestamps(ball_indices: np.ndarray, mapping_array: np.ndarray) -> np.ndarray:
+    """
+    Vectorized get_video_timestamp for many balls at once.
+    mapping_array comes from build_mapping_array; unmapped or out-of-range
+    ball indices resolve to -1.
+    """
+    ball_indices = np.asarray(ball_indices, dtype=np.intp)
+    in_range = (ball_indices >= 0) & (ball_indices < len(mapping_array))
+    return np.where(in_range, mapping_array.take(ball_indices, mode="clip"), -1).astype(np.int32, copy=False)
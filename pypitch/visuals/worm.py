@@ -1,7 +1,97 @@
+import functools
+from types import SimpleNamespace
 from typing import Any, Optional
 
+import numpy as np
+
+from pypitch.exceptions import MatchDataMissing
+
 __all__ = ['plot_match_worm', 'plot_run_pressure', 'plot_batter_pacing', 'plot_momentum_swings', 'plot_manhattan', 'plot_beehive', 'plot_wagon_wheel', 'plot_partnership_flow']
 
+@functools.lru_cache(maxsize=None)
+def _mpl() -> SimpleNamespace:
+    """
+    Imports matplotlib on first use and hands back the pieces this module
+    draws with. matplotlib is optional, so importing pypitch must not need it.
+    """
+    import matplotlib.pyplot as pyplot
+    import matplotlib.patches as patches
+    from matplotlib.collections import LineCollection
+    return SimpleNamespace(pyplot=pyplot, patches=patches, LineCollection=LineCollection)
+
+def _fetch_df(session: Any, sql: str, params: Optional[list] = None) -> Any:
+    """
+    Runs a query through the session engine and converts the Arrow result to pandas.
+
+    split_blocks gives each column its own pandas block, skipping the
+    consolidation copy. self_destruct is not used: engines may hand back a
+    cached Arrow table that later queries share.
+    """
+    return session.engine.execute_sql(sql, params, cache=True).to_pandas(split_blocks=True)
+
+def _fetch_arrays(session: Any, sql: str, params: Optional[list] = None) -> dict:
+    """
+    Runs a query and returns each result column as a NumPy array, for
+    plots that only slice columns and never need a DataFrame.
+    """
+    table = session.engine.execute_sql(sql, params, cache=True)
+    return {name: table.column(name).to_numpy() for name in table.column_names}
+
+def _entity_names(session: Any, ids: Any) -> dict:
+    """
+    Resolves entity IDs to primary names with one registry query.
+    The registry lives in its own database, so this cannot be a JOIN.
+    """
+    unique_ids = sorted({int(i) for i in ids})
+    if not unique_ids:
+        return {}
+    rows = session.registry.con.execute(
+        "SELECT id, primary_name FROM entities WHERE id IN (SELECT UNNEST(?))", [unique_ids]
+    ).fetchall()
+    return dict(rows)
+
+def _format_entity_list(session: Any, ids: list) -> str:
+    """Bullet list of 'Name (ID: n)' lines for error messages."""
+    try:
+        names = _entity_names(session, ids)
+    except Exception:
+        return "\n".join(f"  - ID: {i}" for i in ids)
+    return "\n".join(f"  - {names.get(int(i), 'Unknown')} (ID: {i})" for i in ids)
+
+# Per-ball match series shared by the match-level line plots. Using one
+# query text lets the engine's result cache serve every chart drawn for the
+# same match after the first, and that cache is dropped on each write.
+_MATCH_BALLS_SQL = """
+    WITH balls AS (
+        SELECT
+            inning, over, ball,
+            is_wicket,
+            batter_id,
+            over + (ball - 1) / 6.0 as over_float,
+            CAST(SUM(runs_batter + runs_extras) OVER w AS BIGINT) as cumulative,
+            ROW_NUMBER() OVER w as balls,
+            AVG(CASE WHEN runs_batter + runs_extras = 0 THEN 1.0 ELSE 0.0 END) OVER w * 100 as dot_pct,
+            CAST(over AS BIGINT) * 7 as par_cum
+        FROM ball_events
+        WHERE match_id = ?
+        WINDOW w AS (PARTITION BY inning ORDER BY over, ball
+                     ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW)
+    ),
+    first_innings AS (
+        SELECT MAX(cumulative) as target FROM balls WHERE inning = 1
+    )
+    SELECT
+        balls.*,
+        cumulative - par_cum as delta_par,
+        cumulative / balls * 6 as rr,  -- Run rate per ball *6
+        -- Required RR over the remaining balls, innings 2 only
+        CASE WHEN inning = 2
+             THEN (first_innings.target - cumulative) / NULLIF(120 - balls, 0) * 6
+        END as required_rr
+    FROM balls, first_innings
+    ORDER BY inning, over, ball
+"""
+
 def _add_cricket_pitch_layout(ax: Any, view: str = "pitch") -> None:
     """
     Add cricket pitch/field layout to plots.
@@ -10,7 +100,7 @@ def _add_cricket_pitch_layout(ax: Any, view: str = "pitch") -> None:
         ax: Matplotlib axis
         view: "pitch" for pitch map, "field" for full field, "wagon" for wagon wheel
     """
-    import matplotlib.patches as patches
+    patches = _mpl().patches
 
     if view == "pitch":
         # Draw the pitch rectangle (22 yards long)
@@ -96,29 +186,38 @@ def _add_cricket_pitch_layout(ax: Any, view: str = "pitch") -> None:
 
         ax.set_title('Wagon Wheel')
 
+# Static layout for _add_cricket_grid, shared by every match-level plot
+# Phases as (start over, length in overs, color): powerplay 1-6, middle 7-15, death 16-20
+_PHASE_RECTS = ((0, 6, 'lightblue'), (6, 9, 'lightyellow'), (15, 5, 'lightcoral'))
+_OVER_LINE_SEGMENTS = tuple(((over, 0), (over, 1)) for over in range(1, 21))
+_OVER_TICKS = tuple(range(0, 21))
+_BALL_TICKS = tuple(i / 6 for i in range(0, 120, 6))
+
 def _add_cricket_grid(ax: Any) -> None:
     """Add cricket-aware grid: thick vertical every over, light per ball, phase shading."""
-    import matplotlib.patches as patches
+    mpl = _mpl()
+    patches, LineCollection = mpl.patches, mpl.LineCollection
     
     # Phase background shading
     ylim = ax.get_ylim()
     height = ylim[1] - ylim[0]
-    # Powerplay: overs 1-6 (light blue)
-    ax.add_patch(patches.Rectangle((0, ylim[0]), 6, height, color='lightblue', alpha=0.1, zorder=0))
-    # Middle: 7-15 (light yellow)
-    ax.add_patch(patches.Rectangle((6, ylim[0]), 9, height, color='lightyellow', alpha=0.1, zorder=0))
-    # Death: 16-20 (light coral)
-    ax.add_patch(patches.Rectangle((15, ylim[0]), 5, height, color='lightcoral', alpha=0.1, zorder=0))
-    
-    # Thick vertical lines every over
-    for over in range(1, 21):
-        ax.axvline(x=over, color='black', linestyle='-', linewidth=1, alpha=0.3)
+    for start, overs, color in _PHASE_RECTS:
+        ax.add_patch(patches.Rectangle((start, ylim[0]), overs, height, color=color, alpha=0.1, zorder=0))
+    
+    # Thick vertical lines every over, as one artist. Like axvline, x is in
+    # data units and y spans the axes, so later rescaling keeps full height.
+    over_lines = LineCollection(
+        _OVER_LINE_SEGMENTS,
+        colors='black', linestyles='-', linewidths=1, alpha=0.3,
+        transform=ax.get_xaxis_transform()
+    )
+    ax.add_collection(over_lines, autolim=False)
     
     # Light grid for balls (every 6 balls, but since over_float, approximate)
     ax.grid(True, which='minor', axis='x', linestyle=':', alpha=0.2)
     ax.grid(True, axis='y', linestyle=':', alpha=0.2)
-    ax.set_xticks(range(0, 21))
-    ax.set_xticks([i/6 for i in range(0, 120, 6)], minor=True)  # Minor ticks every ball
+    ax.set_xticks(_OVER_TICKS)
+    ax.set_xticks(_BALL_TICKS, minor=True)  # Minor ticks every ball
 
 def plot_worm_graph(match_id: str, bowler_id: int, session: Any, ax: Optional[Any] = None) -> Any:
     """
@@ -136,15 +235,11 @@ def plot_worm_graph(match_id: str, bowler_id: int, session: Any, ax: Optional[An
     Raises:
         pypitch.exceptions.MatchDataMissing: If match data is not available.
     """
-    import matplotlib.pyplot as plt
-    import pandas as pd
-    from pypitch.exceptions import MatchDataMissing
+    plt = _mpl().pyplot
 
     # Parameterized query - NO f-strings
     query = """
         SELECT 
-            over, 
-            ball, 
             runs_batter + runs_extras as runs_conceded,
             is_wicket
         FROM ball_events 
@@ -155,8 +250,7 @@ def plot_worm_graph(match_id: str, bowler_id: int, session: Any, ax: Optional[An
     
     try:
         # Execute with parameters
-        arrow_table = session.engine.execute_sql(query, [match_id, bowler_id])
-        df = arrow_table.to_pandas()
+        df = _fetch_df(session, query, [match_id, bowler_id])
     except Exception:
         # DuckDB throws if table doesn't exist or other SQL errors
         # We assume mostly it's missing data if the query fails on a valid schema
@@ -164,18 +258,8 @@ def plot_worm_graph(match_id: str, bowler_id: int, session: Any, ax: Optional[An
 
     if df.empty:
         try:
-            bowler_table = session.engine.execute_sql(f"SELECT DISTINCT bowler_id FROM ball_events WHERE match_id = '{match_id}'")
-            bowler_df = bowler_table.to_pandas()
-            bowler_names = []
-            for bid in bowler_df['bowler_id'].tolist():
-                # Try to get name from registry
-                try:
-                    name = session.registry.con.execute("SELECT primary_name FROM entities WHERE id = ?", [bid]).fetchone()
-                    bowler_names.append(f"{name[0] if name else 'Unknown'} (ID: {bid})")
-                except Exception:
-                    bowler_names.append(f"ID: {bid}")
-            
-            bowlers_list = "\n".join(f"  - {name}" for name in bowler_names)
+            bowler_df = _fetch_df(session, "SELECT DISTINCT bowler_id FROM ball_events WHERE match_id = ?", [match_id])
+            bowlers_list = _format_entity_list(session, bowler_df['bowler_id'].tolist())
             error_msg = f"No data found for bowler {bowler_id} in match {match_id}.\n\nBowlers who bowled in this match:\n{bowlers_list}\n\nTip: Try a different match where this bowler participated."
         except Exception:
             error_msg = f"No data found for bowler {bowler_id} in match {match_id}. Ensure the match data is loaded."
@@ -219,39 +303,16 @@ def plot_match_worm(match_id: str, session: Any, ax: Optional[Any] = None) -> An
     Raises:
         pypitch.exceptions.MatchDataMissing: If match data is not available.
     """
-    import matplotlib.pyplot as plt
-    import pandas as pd
-    from pypitch.exceptions import MatchDataMissing
+    plt = _mpl().pyplot
 
-    # Parameterized query with wicket details
-    query = """
-        SELECT 
-            inning,
-            over,
-            ball,
-            runs_batter + runs_extras as runs_scored,
-            is_wicket,
-            batter_id,
-            bowler_id,
-            wicket_type
-        FROM ball_events 
-        WHERE match_id = ?
-        ORDER BY inning, over, ball
-    """
-    
     try:
-        arrow_table = session.engine.execute_sql(query, [match_id])
-        df = arrow_table.to_pandas()
+        df = _fetch_df(session, _MATCH_BALLS_SQL, [match_id])
     except Exception:
         raise MatchDataMissing(f"Match ID {match_id} does not have ball-by-ball data")
 
     if df.empty:
         raise MatchDataMissing(f"No data found for match {match_id}")
 
-    # Calculate over_float and cumulative runs
-    df['over_float'] = df['over'] + (df['ball'] - 1) / 6  # ball 1-6 -> 0 to 5/6
-    df['cumulative_runs'] = df.groupby('inning')['runs_scored'].cumsum()
-
     if ax is None:
         fig, ax = plt.subplots(figsize=(14, 8))
     
@@ -260,9 +321,10 @@ def plot_match_worm(match_id: str, session: Any, ax: Optional[Any] = None) -> An
 
     # Plot innings lines (hero metric)
     colors = ['darkgreen', 'darkblue']  # Cricket colors
-    for i, inning in enumerate(df['inning'].unique()):
+    innings = df['inning'].unique()
+    for i, inning in enumerate(innings):
         inning_data = df[df['inning'] == inning]
-        ax.plot(inning_data['over_float'], inning_data['cumulative_runs'], 
+        ax.plot(inning_data['over_float'], inning_data['cumulative'], 
                 color=colors[i], linewidth=3, label=f'Inning {inning}')
     
     # Par score line (secondary, low opacity)
@@ -272,23 +334,23 @@ def plot_match_worm(match_id: str, session: Any, ax: Optional[Any] = None) -> An
     # Mark wickets (cricket-native)
     wickets = df[df['is_wicket'] == True]
     if not wickets.empty:
+        # Resolve all dismissed batters' names in one registry query
+        batter_names = _entity_names(session, wickets['batter_id'])
         for _, wicket in wickets.iterrows():
-            # Resolve names
-            batter_name = session.registry.con.execute("SELECT primary_name FROM entities WHERE id = ?", [int(wicket['batter_id'])]).fetchone()
-            batter_name = batter_name[0] if batter_name else 'Unknown'
-            
-            ax.scatter(wicket['over_float'], wicket['cumulative_runs'], 
+            batter_name = batter_names.get(int(wicket['batter_id']), 'Unknown')
+
+            ax.scatter(wicket['over_float'], wicket['cumulative'], 
                       marker='^', color='red', s=60, zorder=5)
             # Simplified annotation: just name and over
             ax.annotate(f"{batter_name}\n({wicket['over']}.{wicket['ball']})",
-                       (wicket['over_float'], wicket['cumulative_runs']),
+                       (wicket['over_float'], wicket['cumulative']),
                        xytext=(5, 5), textcoords='offset points', fontsize=8,
                        bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.7))
 
     # Y-axis: for T20, cap to reasonable (assume 20 overs, target + buffer)
-    max_runs = df['cumulative_runs'].max()
+    max_runs = df['cumulative'].max()
     if max_runs > 300:  # T20 context
-        target = df[df['inning'] == 1]['cumulative_runs'].max() if 1 in df['inning'].unique() else max_runs
+        target = df[df['inning'] == 1]['cumulative'].max() if 1 in innings else max_runs
         ax.set_ylim(0, target + 50)
     else:
         ax.set_ylim(bottom=0)
@@ -318,31 +380,16 @@ def plot_run_pressure(match_id: str, session: Any, ax: Optional[Any] = None) ->
     Raises:
         pypitch.exceptions.MatchDataMissing: If match data is not available.
     """
-    import matplotlib.pyplot as plt
-    import pandas as pd
-    from pypitch.exceptions import MatchDataMissing
+    plt = _mpl().pyplot
 
-    query = """
-        SELECT inning, over, ball, runs_batter + runs_extras as runs_scored
-        FROM ball_events 
-        WHERE match_id = ?
-        ORDER BY inning, over, ball
-    """
-    
     try:
-        arrow_table = session.engine.execute_sql(query, [match_id])
-        df = arrow_table.to_pandas()
+        df = _fetch_df(session, _MATCH_BALLS_SQL, [match_id])
     except Exception:
         raise MatchDataMissing(f"Match ID {match_id} does not have ball-by-ball data")
 
     if df.empty:
         raise MatchDataMissing(f"No data found for match {match_id}")
 
-    df['over_float'] = df['over'] + (df['ball'] - 1) / 6
-    df['cumulative'] = df.groupby('inning')['runs_scored'].cumsum()
-    df['balls'] = df.groupby('inning').cumcount() + 1
-    df['rr'] = df['cumulative'] / df['balls'] * 6  # Run rate per ball *6
-
     if ax is None:
         fig, ax = plt.subplots(figsize=(14, 8))
     
@@ -350,29 +397,26 @@ def plot_run_pressure(match_id: str, session: Any, ax: Optional[Any] = None) ->
 
     # Plot run rates (hero: team RR)
     colors = ['darkgreen', 'darkblue']
-    for i, inning in enumerate(df['inning'].unique()):
+    innings = df['inning'].unique()
+    for i, inning in enumerate(innings):
         inning_data = df[df['inning'] == inning]
         ax.plot(inning_data['over_float'], inning_data['rr'], 
                 color=colors[i], linewidth=3, label=f'Inning {inning} RR')
     
     # Required RR for innings 2 (secondary, low opacity)
-    if len(df['inning'].unique()) > 1:
+    if len(innings) > 1:
         innings2 = df[df['inning'] == 2]
-        target = df[df['inning'] == 1]['cumulative'].max()
-        innings2['required_rr'] = (target - innings2['cumulative']) / (120 - innings2['balls']) * 6  # Remaining balls
         ax.plot(innings2['over_float'], innings2['required_rr'], 
                 color='orange', linestyle='--', linewidth=2, label='Required RR', alpha=0.6)
     
-    # Dot-ball % (secondary)
-    df['is_dot'] = df['runs_scored'] == 0
-    df['dot_pct'] = df.groupby('inning')['is_dot'].expanding().mean() * 100
-    for i, inning in enumerate(df['inning'].unique()):
+    # Dot-ball % (secondary), all innings on one twin axis
+    ax2 = ax.twinx()
+    for i, inning in enumerate(innings):
         inning_data = df[df['inning'] == inning]
-        ax2 = ax.twinx()
         ax2.plot(inning_data['over_float'], inning_data['dot_pct'], 
                  color='red', linestyle=':', linewidth=1, label='Dot-ball %', alpha=0.4)
-        ax2.set_ylabel('Dot-ball %', color='red')
-        ax2.tick_params(axis='y', labelcolor='red')
+    ax2.set_ylabel('Dot-ball %', color='red')
+    ax2.tick_params(axis='y', labelcolor='red')
 
     ax.set_title(f"Run Pressure: Rates & Dot-balls (Match {match_id})", fontsize=14, fontweight='bold')
     ax.set_xlabel("Overs", fontsize=12)
@@ -401,61 +445,45 @@ def plot_batter_pacing(match_id: str, batsman_id: int, session: Any, ax: Optiona
     Raises:
         pypitch.exceptions.MatchDataMissing: If match data is not available.
     """
-    import matplotlib.pyplot as plt
-    import pandas as pd
-    from pypitch.exceptions import MatchDataMissing
+    plt = _mpl().pyplot
 
     # Parameterized query
     query = """
         SELECT 
-            inning,
             over, 
             ball, 
-            runs_batter + runs_extras as runs_scored,
             runs_batter,
             is_wicket,
-            bowler_id,
-            wicket_type
+            wicket_type,
+            CAST(SUM(runs_batter + runs_extras) OVER (
+                ORDER BY over, ball ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+            ) AS BIGINT) as cumulative_runs,
+            ROW_NUMBER() OVER (ORDER BY over, ball) as balls_faced,
+            -- Strike rate over the last 10 balls faced
+            SUM(runs_batter + runs_extras) OVER last_10
+                / COUNT(*) OVER last_10 * 100 as rolling_sr
         FROM ball_events 
         WHERE match_id = ? 
           AND batter_id = ?
+        WINDOW last_10 AS (ORDER BY over, ball ROWS BETWEEN 9 PRECEDING AND CURRENT ROW)
         ORDER BY over, ball
     """
     
     try:
-        arrow_table = session.engine.execute_sql(query, [match_id, batsman_id])
-        df = arrow_table.to_pandas()
+        df = _fetch_df(session, query, [match_id, batsman_id])
     except Exception:
         raise MatchDataMissing(f"Match ID {match_id} does not have ball-by-ball data")
 
     if df.empty:
         try:
-            batsman_table = session.engine.execute_sql("SELECT DISTINCT batter_id FROM ball_events WHERE match_id = ?", [match_id])
-            batsman_df = batsman_table.to_pandas()
-            batsman_names = []
-            for bid in batsman_df['batter_id'].tolist():
-                try:
-                    name = session.registry.con.execute("SELECT primary_name FROM entities WHERE id = ?", [bid]).fetchone()
-                    batsman_names.append(f"{name[0] if name else 'Unknown'} (ID: {bid})")
-                except Exception:
-                    batsman_names.append(f"ID: {bid}")
-            
-            batsmen_list = "\n".join(f"  - {name}" for name in batsman_names)
+            batsman_df = _fetch_df(session, "SELECT DISTINCT batter_id FROM ball_events WHERE match_id = ?", [match_id])
+            batsmen_list = _format_entity_list(session, batsman_df['batter_id'].tolist())
             error_msg = f"No data found for batsman {batsman_id} in match {match_id}.\n\nBatsmen who batted in this match:\n{batsmen_list}\n\nTip: Try a different match where this batsman participated."
         except Exception:
             error_msg = f"No data found for batsman {batsman_id} in match {match_id}. Ensure the match data is loaded."
         
         raise MatchDataMissing(error_msg)
 
-    # Calculate over_float and cumulative
-    df['over_float'] = df['over'] + (df['ball'] - 1) / 6
-    df['cumulative_runs'] = df['runs_scored'].cumsum()
-    df['balls_faced'] = range(1, len(df) + 1)
-    
-    # Calculate rolling strike rate
-    df['rolling_sr'] = (df['runs_scored'].rolling(window=10, min_periods=1).sum() / 
-                       df['balls_faced'].rolling(window=10, min_periods=1).count() * 100)
-    
     if ax is None:
         fig, ax = plt.subplots(figsize=(14, 8))
     
@@ -475,16 +503,15 @@ def plot_batter_pacing(match_id: str, batsman_id: int, session: Any, ax: Optiona
     ax2.set_ylim(0, 250)  # SR range
 
     # Boundaries (subtle)
-    boundaries = df[df['runs_batter'].isin([4, 6])]
-    if not boundaries.empty:
-        for _, b in boundaries.iterrows():
-            marker = '*' if b['runs_batter'] == 6 else 'o'
-            color = 'red' if b['runs_batter'] == 6 else 'blue'
-            ax.scatter(b['balls_faced'], b['cumulative_runs'], marker=marker, color=color, s=50, alpha=0.7, zorder=5)
+    for runs, marker, color in ((4, 'o', 'blue'), (6, '*', 'red')):
+        hits = df[df['runs_batter'] == runs]
+        if not hits.empty:
+            ax.scatter(hits['balls_faced'], hits['cumulative_runs'], marker=marker, color=color, s=50, alpha=0.7, zorder=5)
 
     # Dismissal annotation (simplified)
-    if df.iloc[-1]['is_wicket']:
-        last = df.iloc[-1]
+    # Scalar reads from the last row, without building a row Series
+    if df['is_wicket'].iat[-1]:
+        last = {col: df[col].iat[-1] for col in ('wicket_type', 'over', 'ball', 'balls_faced', 'cumulative_runs')}
         ax.annotate(f"Out: {last['wicket_type']}\n({last['over']}.{last['ball']})",
                    (last['balls_faced'], last['cumulative_runs']),
                    xytext=(10, -10), textcoords='offset points', fontsize=9,
@@ -525,34 +552,19 @@ def plot_momentum_swings(match_id: str, session: Any, ax: Optional[Any] = None)
     Raises:
         pypitch.exceptions.MatchDataMissing: If match data is not available.
     """
-    import matplotlib.pyplot as plt
-    import pandas as pd
-    from pypitch.exceptions import MatchDataMissing
+    plt = _mpl().pyplot
 
-    query = """
-        SELECT inning, over, ball, runs_batter + runs_extras as runs_scored
-        FROM ball_events 
-        WHERE match_id = ?
-        ORDER BY inning, over, ball
-    """
-    
     try:
-        arrow_table = session.engine.execute_sql(query, [match_id])
-        df = arrow_table.to_pandas()
+        data = _fetch_arrays(session, _MATCH_BALLS_SQL, [match_id])
     except Exception:
         raise MatchDataMissing(f"Match ID {match_id} does not have ball-by-ball data")
 
-    if df.empty:
+    if len(data['inning']) == 0:
         raise MatchDataMissing(f"No data found for match {match_id}")
 
-    df['over_float'] = df['over'] + (df['ball'] - 1) / 6
-    df['cumulative'] = df.groupby('inning')['runs_scored'].cumsum()
-
-    # Calculate par cumulative
-    df['par_cum'] = df['over'].astype(int) * 7  # Simple par
-
-    # Difference from par
-    df['delta_par'] = df['cumulative'] - df['par_cum']
+    innings = data['inning']
+    x = data['over_float']
+    delta = data['delta_par']
 
     if ax is None:
         fig, ax = plt.subplots(figsize=(14, 8))
@@ -561,14 +573,16 @@ def plot_momentum_swings(match_id: str, session: Any, ax: Optional[Any] = None)
 
     # Plot delta per inning (hero)
     colors = ['darkgreen', 'darkblue']
-    for i, inning in enumerate(df['inning'].unique()):
-        inning_data = df[df['inning'] == inning]
-        ax.plot(inning_data['over_float'], inning_data['delta_par'], 
+    for i, inning in enumerate(np.unique(innings)):
+        in_inning = innings == inning
+        ax.plot(x[in_inning], delta[in_inning], 
                 color=colors[i], linewidth=3, label=f'Inning {inning} Δ vs Par')
     
     ax.axhline(0, color='black', linestyle='-', alpha=0.5, label='Par')
-    ax.fill_between(df['over_float'], df['delta_par'], 0, where=df['delta_par'] >= 0, color='green', alpha=0.2)
-    ax.fill_between(df['over_float'], df['delta_par'], 0, where=df['delta_par'] < 0, color='red', alpha=0.2)
+    # One sign mask; interpolate closes the gaps at par crossings
+    ahead = delta >= 0
+    ax.fill_between(x, delta, 0, where=ahead, color='green', alpha=0.2, interpolate=True)
+    ax.fill_between(x, delta, 0, where=~ahead, color='red', alpha=0.2, interpolate=True)
 
     ax.set_title(f"Momentum Swings: Δ Runs vs Par (Match {match_id})", fontsize=14, fontweight='bold')
     ax.set_xlabel("Overs", fontsize=12)
@@ -578,56 +592,6 @@ def plot_momentum_swings(match_id: str, session: Any, ax: Optional[Any] = None)
     ax.set_facecolor('whitesmoke')
     
     return ax
-    """
-    Plots a Manhattan chart: runs scored per over in a match.
-
-    Args:
-        match_id (str): The match identifier.
-        session (Any): PyPitch session object.
-        ax (Any, optional): Matplotlib axis. If None, creates a new figure.
-
-    Returns:
-        Any: The matplotlib axis with the plot.
-
-    Raises:
-        pypitch.exceptions.MatchDataMissing: If match data is not available.
-    """
-    import matplotlib.pyplot as plt
-    import pandas as pd
-    from pypitch.exceptions import MatchDataMissing
-
-    query = """
-        SELECT inning, over, SUM(runs_batter + runs_extras) as runs_per_over
-        FROM ball_events 
-        WHERE match_id = ?
-        GROUP BY inning, over
-        ORDER BY inning, over
-    """
-    
-    try:
-        arrow_table = session.engine.execute_sql(query, [match_id])
-        df = arrow_table.to_pandas()
-    except Exception:
-        raise MatchDataMissing(f"Match ID {match_id} does not have ball-by-ball data")
-
-    if df.empty:
-        raise MatchDataMissing(f"No data found for match {match_id}")
-
-    if ax is None:
-        fig, ax = plt.subplots(figsize=(14, 8))
-
-    colors = ['darkgreen', 'darkblue']
-    for i, inning in enumerate(df['inning'].unique()):
-        inning_data = df[df['inning'] == inning]
-        ax.bar(inning_data['over'] + (i * 0.4), inning_data['runs_per_over'], width=0.4, color=colors[i], label=f'Inning {inning}')
-
-    ax.set_title(f"Manhattan Chart: Runs per Over (Match {match_id})")
-    ax.set_xlabel("Over")
-    ax.set_ylabel("Runs Scored")
-    ax.legend()
-    ax.grid(True, axis='y', linestyle=':', alpha=0.3)
-    
-    return ax
 
 
 def plot_manhattan(match_id: str, session: Any, ax: Optional[Any] = None) -> Any:
@@ -646,41 +610,32 @@ def plot_manhattan(match_id: str, session: Any, ax: Optional[Any] = None) -> Any
     Raises:
         pypitch.exceptions.MatchDataMissing: If match data is not available.
     """
-    import matplotlib.pyplot as plt
-    import pandas as pd
-    import numpy as np
-    from pypitch.exceptions import MatchDataMissing
+    plt = _mpl().pyplot
 
-    # Get detailed ball-by-ball for color coding
+    # Runs per over plus the events that decide each bar's color
     query = """
-        SELECT inning, over, ball, runs_batter + runs_extras as runs_scored, is_wicket, runs_batter
+        SELECT
+            inning,
+            over,
+            CAST(SUM(runs_batter + runs_extras) AS BIGINT) as runs_scored,
+            COALESCE(BOOL_OR(is_wicket), FALSE) as had_wicket,
+            COALESCE(BOOL_OR(runs_batter >= 4), FALSE) as had_boundary,
+            COALESCE(BOOL_OR(runs_batter + runs_extras > 0), FALSE) as had_runs
         FROM ball_events 
         WHERE match_id = ?
-        ORDER BY inning, over, ball
+        GROUP BY inning, over
+        ORDER BY inning, over
     """
     
     try:
-        arrow_table = session.engine.execute_sql(query, [match_id])
-        df = arrow_table.to_pandas()
+        data = _fetch_arrays(session, query, [match_id])
     except Exception:
         raise MatchDataMissing(f"Match ID {match_id} does not have ball-by-ball data")
 
-    if df.empty:
+    innings = data['inning']
+    if len(innings) == 0:
         raise MatchDataMissing(f"No data found for match {match_id}")
 
-    # Group by over and inning, but track events
-    df['event_type'] = np.select(
-        [df['is_wicket'] == True, df['runs_batter'] >= 4, df['runs_scored'] == 0],
-        ['wicket', 'boundary', 'dot'],
-        default='normal'
-    )
-    
-    # Aggregate runs per over
-    over_data = df.groupby(['inning', 'over']).agg({
-        'runs_scored': 'sum',
-        'event_type': lambda x: x.tolist()  # Keep all events in over
-    }).reset_index()
-
     if ax is None:
         fig, ax = plt.subplots(figsize=(14, 8))
 
@@ -689,27 +644,20 @@ def plot_manhattan(match_id: str, session: Any, ax: Optional[Any] = None) -> Any
     colors = ['darkgreen', 'darkblue']
     event_colors = {'wicket': 'red', 'boundary': 'green', 'dot': 'grey', 'normal': 'blue'}
     
-    for i, inning in enumerate(over_data['inning'].unique()):
-        inning_data = over_data[over_data['inning'] == inning]
-        
-        # For each over, determine dominant color based on events
-        for _, over_row in inning_data.iterrows():
-            events = over_row['event_type']
-            # Priority: wicket > boundary > normal > dot
-            if 'wicket' in events:
-                color = event_colors['wicket']
-            elif 'boundary' in events:
-                color = event_colors['boundary']
-            elif 'normal' in events:
-                color = colors[i]  # Use inning color for normal overs
-            else:
-                color = event_colors['dot']
-            
-            ax.bar(over_row['over'] + (i * 0.4), over_row['runs_scored'], 
-                   width=0.4, color=color, edgecolor='black', linewidth=0.5)
+    for i, inning in enumerate(np.unique(innings)):
+        in_inning = innings == inning
+
+        # Dominant event per over. Priority: wicket > boundary > normal > dot
+        bar_colors = np.select(
+            [data['had_wicket'][in_inning], data['had_boundary'][in_inning], data['had_runs'][in_inning]],
+            [event_colors['wicket'], event_colors['boundary'], colors[i]],  # Inning color for normal overs
+            default=event_colors['dot']
+        )
+        ax.bar(data['over'][in_inning] + (i * 0.4), data['runs_scored'][in_inning],
+               width=0.4, color=bar_colors, edgecolor='black', linewidth=0.5)
 
     # Legend
-    from matplotlib.patches import Patch
+    Patch = _mpl().patches.Patch
     legend_elements = [
         Patch(facecolor='red', label='Wicket'),
         Patch(facecolor='green', label='Boundary'),
@@ -743,22 +691,18 @@ def plot_beehive(match_id: str, bowler_id: int, session: Any, ax: Optional[Any]
     Raises:
         pypitch.exceptions.MatchDataMissing: If match data is not available.
     """
-    import matplotlib.pyplot as plt
-    import pandas as pd
-    import numpy as np
-    from pypitch.exceptions import MatchDataMissing
+    plt = _mpl().pyplot
 
     # For now, simulate pitch locations (would need actual data)
     query = """
-        SELECT over, ball, runs_batter + runs_extras as runs_scored
+        SELECT runs_batter + runs_extras as runs_scored
         FROM ball_events 
         WHERE match_id = ? AND bowler_id = ?
         ORDER BY over, ball
     """
     
     try:
-        arrow_table = session.engine.execute_sql(query, [match_id, bowler_id])
-        df = arrow_table.to_pandas()
+        df = _fetch_df(session, query, [match_id, bowler_id])
     except Exception:
         raise MatchDataMissing(f"Match ID {match_id} does not have ball-by-ball data")
 
@@ -773,25 +717,22 @@ def plot_beehive(match_id: str, bowler_id: int, session: Any, ax: Optional[Any]
 
     # Simulate pitch locations (length and line)
     # In real implementation, this would come from ball trajectory data
-    np.random.seed(42)  # For reproducible demo
+    # Local generator: reproducible demo without reseeding NumPy's global state
+    rng = np.random.default_rng(42)
     n_balls = len(df)
     
     # Length: 0-22 yards (pitch is 22 yards)
-    lengths = np.random.uniform(0, 22, n_balls)
+    lengths = rng.uniform(0, 22, n_balls)
     # Line: -3 to 3 (off-side to leg-side)
-    lines = np.random.normal(0, 1.5, n_balls)
+    lines = rng.normal(0, 1.5, n_balls)
     
-    # Color by outcome
-    colors = []
-    for _, ball in df.iterrows():
-        if ball['runs_scored'] == 0:
-            colors.append('green')  # Dot ball
-        elif ball['runs_scored'] >= 4:
-            colors.append('red')    # Boundary
-        else:
-            colors.append('blue')   # Normal
+    # Color by outcome: dot ball green, boundary red, otherwise blue
+    runs = df['runs_scored'].to_numpy()
+    colors = np.select([runs == 0, runs >= 4], ['green', 'red'], default='blue')
 
-    scatter = ax.scatter(lines, lengths, c=colors, s=50, alpha=0.7, edgecolors='black')
+    # Rasterized so PDF/SVG exports embed one image instead of a path per ball
+    scatter = ax.scatter(lines, lengths, c=colors, s=50, alpha=0.7, edgecolors='black',
+                         rasterized=True)
 
     # Add legend
     legend_elements = [
@@ -804,26 +745,6 @@ def plot_beehive(match_id: str, bowler_id: int, session: Any, ax: Optional[Any]
     ax.set_title(f"Beehive: Pitch Map for Bowler {bowler_id} (Match {match_id})")
     
     return ax
-    
-    # Stumps at 0 yards
-    ax.axhline(0, color='black', linewidth=3, label='Stumps')
-    
-    # Off-side/leg-side markers
-    ax.axvline(-1.5, color='grey', linestyle='--', alpha=0.5, label='Off-side')
-    ax.axvline(1.5, color='grey', linestyle='--', alpha=0.5, label='Leg-side')
-
-    ax.set_xlim(-4, 4)
-    ax.set_ylim(0, 22)
-    ax.set_xlabel('Line (Off-side to Leg-side)')
-    ax.set_ylabel('Length (yards from stumps)')
-    ax.set_title(f"Beehive: Pitch Map (Match {match_id})")
-    ax.legend()
-    ax.grid(True, alpha=0.3)
-    
-    # Invert y-axis so 0 is at bottom (stumps)
-    ax.invert_yaxis()
-    
-    return ax
 
 
 def plot_wagon_wheel(match_id: str, batsman_id: int, session: Any, ax: Optional[Any] = None) -> Any:
@@ -842,10 +763,7 @@ def plot_wagon_wheel(match_id: str, batsman_id: int, session: Any, ax: Optional[
     Raises:
         pypitch.exceptions.MatchDataMissing: If match data is not available.
     """
-    import matplotlib.pyplot as plt
-    import pandas as pd
-    import numpy as np
-    from pypitch.exceptions import MatchDataMissing
+    plt = _mpl().pyplot
 
     # Simplified: assume random directions for boundaries
     query = """
@@ -856,8 +774,7 @@ def plot_wagon_wheel(match_id: str, batsman_id: int, session: Any, ax: Optional[
     """
     
     try:
-        arrow_table = session.engine.execute_sql(query, [match_id, batsman_id])
-        df = arrow_table.to_pandas()
+        df = _fetch_df(session, query, [match_id, batsman_id])
     except Exception:
         raise MatchDataMissing(f"Match ID {match_id} does not have ball-by-ball data")
 
@@ -872,9 +789,9 @@ def plot_wagon_wheel(match_id: str, batsman_id: int, session: Any, ax: Optional[
 
     # Simulate directions
     angles = np.random.uniform(0, 2*np.pi, len(df))
-    radii = np.ones(len(df)) * 10
-    colors = ['blue' if r == 4 else 'red' for r in df['runs_batter']]
-    ax.scatter(angles, radii, c=colors, s=100, alpha=0.7)
+    radii = np.full(len(df), 10.0)
+    colors = np.where(df['runs_batter'].to_numpy() == 4, 'blue', 'red')
+    ax.scatter(angles, radii, c=colors, s=100, alpha=0.7, rasterized=True)
 
     # Add legend
     legend_elements = [
@@ -904,40 +821,44 @@ def plot_partnership_flow(match_id: str, session: Any, ax: Optional[Any] = None)
     Raises:
         pypitch.exceptions.MatchDataMissing: If match data is not available.
     """
-    import matplotlib.pyplot as plt
-    import pandas as pd
-    from pypitch.exceptions import MatchDataMissing
+    plt = _mpl().pyplot
 
+    # One row per partnership (unordered batter pair), aggregated in DuckDB
     query = """
-        SELECT inning, batter_id, non_striker_id, over, ball, runs_batter + runs_extras as runs_scored
+        SELECT
+            inning,
+            LEAST(batter_id, non_striker_id) as partnership_lo,
+            GREATEST(batter_id, non_striker_id) as partnership_hi,
+            CAST(SUM(runs_batter + runs_extras) AS BIGINT) as runs,
+            MIN(over) as start_over,
+            MAX(over) as end_over
         FROM ball_events 
         WHERE match_id = ?
-        ORDER BY inning, over, ball
+        GROUP BY inning, partnership_lo, partnership_hi
+        ORDER BY inning, partnership_lo, partnership_hi
     """
     
     try:
-        arrow_table = session.engine.execute_sql(query, [match_id])
-        df = arrow_table.to_pandas()
+        partnerships = _fetch_df(session, query, [match_id])
     except Exception:
         raise MatchDataMissing(f"Match ID {match_id} does not have ball-by-ball data")
 
-    if df.empty:
+    if partnerships.empty:
         raise MatchDataMissing(f"No data found for match {match_id}")
 
-    # Group by partnership (batter + non_striker)
-    df['partnership'] = df.apply(lambda x: tuple(sorted([x['batter_id'], x['non_striker_id']])), axis=1)
-    partnerships = df.groupby(['inning', 'partnership']).agg({'runs_scored': 'sum', 'over': ['min', 'max']}).reset_index()
-    partnerships.columns = ['inning', 'partnership', 'runs', 'start_over', 'end_over']
-
     if ax is None:
         fig, ax = plt.subplots(figsize=(14, 8))
 
-    colors = ['darkgreen', 'darkblue']
-    for i, inning in enumerate(partnerships['inning'].unique()):
-        inn_data = partnerships[partnerships['inning'] == inning]
-        for _, p in inn_data.iterrows():
-            width = p['runs'] / 10  # Scale for visibility
-            ax.barh(str(p['partnership']), p['end_over'] - p['start_over'], left=p['start_over'], height=width, color=colors[i], alpha=0.7)
+    colors = np.array(['darkgreen', 'darkblue'])
+    # Rows come sorted by inning, so the inverse index is the innings' position
+    _, inning_idx = np.unique(partnerships['inning'].to_numpy(), return_inverse=True)
+    # One row per partnership on a numeric axis, labelled once
+    y_pos = np.arange(len(partnerships))
+    labels = [f"({lo}, {hi})" for lo, hi in zip(partnerships['partnership_lo'], partnerships['partnership_hi'])]
+    ax.barh(y_pos, partnerships['end_over'] - partnerships['start_over'], left=partnerships['start_over'],
+            height=partnerships['runs'] / 10,  # Scale for visibility
+            color=colors[inning_idx], alpha=0.7)
+    ax.set_yticks(y_pos, labels)
 
     ax.set_title(f"Partnership Flow: Ribbon Width by Runs (Match {match_id})")
     ax.set_xlabel("Overs")
@@ -1,14 +1,23 @@
 #!/usr/bin/env python3
-import urllib.request
+import socket
 import sys
 
+# A raw socket probe keeps each healthcheck run free of the urllib/http.client imports
+REQUEST = b"GET /health HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n"
+
 def check_health():
     try:
-        with urllib.request.urlopen('http://localhost:8000/health', timeout=5) as response:
-            if response.getcode() == 200:
-                sys.exit(0)
-            else:
-                sys.exit(1)
+        with socket.create_connection(("localhost", 8000), timeout=5) as sock:
+            sock.sendall(REQUEST)
+            # Read to EOF (Connection: close) so the server never sees a reset
+            status = sock.recv(64)
+            while sock.recv(4096):
+                pass
+        # Status line: "HTTP/1.x 200 OK"
+        if status.startswith(b"HTTP/") and status[9:12] == b"200":
+            sys.exit(0)
+        else:
+            sys.exit(1)
     except Exception:
         sys.exit(1)
 
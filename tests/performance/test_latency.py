@@ -5,12 +5,45 @@ Ensures that core operations remain fast and don't regress over time.
 Uses pytest-benchmark to track query performance.
 """
 
+import json
 import pytest
 import tempfile
 from pathlib import Path
 from pypitch.api.session import PyPitchSession
 from pypitch.data.loader import DataLoader
 
+# One small Cricsheet-style match so load_match benchmarks the real parse and ingest
+SAMPLE_MATCH_ID = "980959"
+SAMPLE_MATCH = {
+    "info": {
+        "match_type_number": 980959,
+        "dates": ["2024-05-20"],
+        "venue": "Wankhede Stadium",
+        "teams": ["RCB", "MI"]
+    },
+    "innings": [
+        {
+            "team": "RCB",
+            "overs": [
+                {
+                    "over": over,
+                    "deliveries": [
+                        {
+                            "batter": "V Kohli",
+                            "bowler": "JJ Bumrah",
+                            "non_striker": "F du Plessis",
+                            "runs": {"batter": ball % 3, "extras": 0, "total": ball % 3},
+                            "wickets": []
+                        }
+                        for ball in range(6)
+                    ]
+                }
+                for over in range(20)
+            ]
+        }
+    ]
+}
+
 @pytest.fixture(scope="session")
 def benchmark_session():
     """Create a test session with sample data for benchmarking."""
@@ -22,6 +55,8 @@ def benchmark_session():
         raw_dir.mkdir(parents=True, exist_ok=True)
         with open(raw_dir / "dummy_match.json", "w") as f:
             f.write("{}")
+        with open(raw_dir / f"{SAMPLE_MATCH_ID}.json", "w") as f:
+            json.dump(SAMPLE_MATCH, f)
 
         # Create minimal test data
         with PyPitchSession(data_dir=str(data_dir), skip_registry_build=True) as session:
@@ -53,8 +88,8 @@ class TestPerformanceRegression:
         # For now, we'll benchmark the method call even if it fails
         def load_match():
             try:
-                benchmark_session.load_match("980959")  # Sample match
-            except:
+                benchmark_session.load_match(SAMPLE_MATCH_ID)
+            except Exception:
                 pass  # Ignore errors for benchmarking
 
         benchmark(load_match)
@@ -78,7 +113,7 @@ class TestPerformanceRegression:
                 # Simple query
                 df = benchmark_session.engine.con.sql("SELECT 1 as test").df()
                 return df
-            except:
+            except Exception:
                 return None
 
         result = benchmark(run_query)
@@ -91,7 +126,7 @@ class TestPerformanceRegression:
 
         query_funcs = {
             "player_stats": lambda: benchmark_session.get_player_stats("V Kohli"),
-            "match_stats": lambda: benchmark_session.load_match("980959"),
+            "match_stats": lambda: benchmark_session.load_match(SAMPLE_MATCH_ID),
             "registry_lookup": lambda: benchmark_session.registry.resolve_player("V Kohli")
         }
 
@@ -99,7 +134,7 @@ class TestPerformanceRegression:
         def safe_query():
             try:
                 return query_funcs[query_type]()
-            except:
+            except Exception:
                 return None
 
         benchmark(safe_query)
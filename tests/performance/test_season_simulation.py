@@ -6,18 +6,23 @@ operations like full season data ingestion and analysis.
 """
 
 import pytest
-import pandas as pd
 import numpy as np
 import pyarrow as pa
 from pathlib import Path
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
 from pypitch.api.session import PyPitchSession
 from pypitch.storage.thread_safe_engine import create_thread_safe_engine
 from pypitch.exceptions import DataIngestionError, QueryExecutionError
 
+@pytest.fixture(scope="module")
+def season_table() -> pa.Table:
+    """Generate the largest season any test needs, once per module."""
+    return TestSeasonSimulation.generate_synthetic_season_data(num_matches=20)
+
 class TestSeasonSimulation:
     """
     Integration tests that simulate processing a full IPL season.
@@ -52,7 +57,8 @@ class TestSeasonSimulation:
             yield session
             session.close()
 
-    def generate_synthetic_season_data(self, num_matches: int = 74) -> pd.DataFrame:
+    @staticmethod
+    def generate_synthetic_season_data(num_matches: int = 74) -> pa.Table:
         """
         Generate synthetic IPL season data for testing.
 
@@ -60,70 +66,66 @@ class TestSeasonSimulation:
             num_matches: Number of matches to generate (default: full IPL season)
 
         Returns:
-            DataFrame with ball-by-ball data for the season
+            Arrow table with ball-by-ball data for the season
         """
-        np.random.seed(42)  # For reproducible tests
-
-        data = []
-        venues = ['Wankhede', 'Eden Gardens', 'Chinnaswamy', 'DYanmond Park', 'Punjab Cricket']
-        teams = ['MI', 'KKR', 'RCB', 'CSK', 'PBKS', 'DC', 'SRH', 'RR']
-
-        for match_id in range(1, num_matches + 1):
-            venue = np.random.choice(venues)
-            team1, team2 = np.random.choice(teams, 2, replace=False)
-
-            # Simulate match
-            target = np.random.randint(150, 220)  # Target score
-
-            for inning in [1, 2]:
-                current_runs = 0
-                wickets = 0
-
-                for over in range(20):
-                    for ball in range(1, 7):
-                        if wickets >= 10:
-                            break
-
-                        # Simulate ball outcome
-                        runs = np.random.choice([0, 1, 2, 3, 4, 6], p=[0.4, 0.25, 0.15, 0.05, 0.1, 0.05])
-                        wicket_fall = np.random.random() < 0.05  # 5% chance of wicket
-
-                        current_runs += runs
-                        if wicket_fall:
-                            wickets += 1
-
-                        # Stop if target reached in second innings
-                        if inning == 2 and current_runs >= target:
-                            break
-
-                        data.append({
-                            'match_id': f'match_{match_id}',
-                            'inning': inning,
-                            'over': over,
-                            'ball': ball,
-                            'runs_total': current_runs,
-                            'wickets_fallen': wickets,
-                            'target': target if inning == 2 else None,
-                            'venue': venue,
-                            'team_batting': team1 if inning == 1 else team2,
-                            'team_bowling': team2 if inning == 1 else team1,
-                            'timestamp': time.time()
-                        })
-
-                    if wickets >= 10 or (inning == 2 and current_runs >= target):
-                        break
-
-        return pd.DataFrame(data)
+        rng = np.random.default_rng(42)  # For reproducible tests
+
+        venues = np.array(['Wankhede', 'Eden Gardens', 'Chinnaswamy', 'DYanmond Park', 'Punjab Cricket'])
+        teams = np.array(['MI', 'KKR', 'RCB', 'CSK', 'PBKS', 'DC', 'SRH', 'RR'])
+
+        # Per-match draws: venue, two distinct teams and the target score
+        match_venue = rng.choice(len(venues), num_matches)
+        pairs = np.argsort(rng.random((num_matches, len(teams))), axis=1)[:, :2]
+        team1, team2 = pairs[:, 0], pairs[:, 1]
+        target = rng.integers(150, 220, num_matches)
+
+        # Every ball of both innings of every match, shaped (match, inning, ball)
+        shape = (num_matches, 2, 120)
+        runs = rng.choice([0, 1, 2, 3, 4, 6], size=shape, p=[0.4, 0.25, 0.15, 0.05, 0.1, 0.05])
+        wicket_fall = rng.random(shape) < 0.05  # 5% chance of wicket
+        runs_total = np.cumsum(runs, axis=2)
+        wickets = np.cumsum(wicket_fall, axis=2)
+
+        # A ball is bowled while fewer than 10 wickets were down before it,
+        # and in the second innings only until the target is reached
+        wickets_before = wickets - wicket_fall
+        bowled = wickets_before < 10
+        bowled[:, 1] &= runs_total[:, 1] < target[:, None]
+
+        match_idx, inning_idx, ball_idx = np.nonzero(bowled)
+        second = inning_idx == 1
+
+        # Low-cardinality strings are dictionary-encoded: int32 codes per row
+        def encoded(codes, values):
+            return pa.DictionaryArray.from_arrays(pa.array(codes, type=pa.int32()), pa.array(values))
+
+        match_ids = np.char.add('match_', np.arange(1, num_matches + 1).astype(str))
+
+        return pa.table({
+            'match_id': encoded(match_idx, match_ids),
+            'inning': pa.array(inning_idx + 1, type=pa.int32()),
+            'over': pa.array(ball_idx // 6, type=pa.int32()),
+            'ball': pa.array(ball_idx % 6 + 1, type=pa.int32()),
+            'runs_total': pa.array(runs_total[bowled], type=pa.int32()),
+            'wickets_fallen': pa.array(wickets[bowled], type=pa.int32()),
+            'target': pa.array(target[match_idx], mask=~second, type=pa.int32()),
+            'venue': encoded(match_venue[match_idx], venues),
+            'team_batting': encoded(np.where(second, team2[match_idx], team1[match_idx]), teams),
+            'team_bowling': encoded(np.where(second, team1[match_idx], team2[match_idx]), teams),
+            'timestamp': np.full(len(match_idx), time.time())
+        })
+
+    @staticmethod
+    def first_matches(season_table: pa.Table, num_matches: int) -> pa.Table:
+        """Rows of the first num_matches matches; rows are grouped by match in order."""
+        match_codes = season_table['match_id'].combine_chunks().indices.to_numpy()
+        return season_table.slice(0, int(np.searchsorted(match_codes, num_matches)))
 
     @pytest.mark.performance
-    def test_full_season_ingestion(self, thread_safe_session, temp_db_path):
+    def test_full_season_ingestion(self, thread_safe_session, season_table, temp_db_path):
         """Test ingesting and processing a full season of data."""
         # Generate season data
-        season_data = self.generate_synthetic_season_data(num_matches=10)  # Smaller for test speed
-
-        # Convert to Arrow table
-        import pyarrow as pa
-        arrow_table = pa.Table.from_pandas(season_data)
+        arrow_table = self.first_matches(season_table, 10)  # Smaller for test speed
 
         # Time the ingestion
         start_time = time.time()
@@ -135,7 +137,7 @@ class TestSeasonSimulation:
         total_deliveries = result['total_deliveries'][0].as_py()
 
         assert total_deliveries > 0, "No data was ingested"
-        assert total_deliveries == len(season_data), f"Expected {len(season_data)} deliveries, got {total_deliveries}"
+        assert total_deliveries == len(arrow_table), f"Expected {len(arrow_table)} deliveries, got {total_deliveries}"
 
         # Performance check - should be reasonable for the data size
         assert ingestion_time < 30, f"Ingestion took too long: {ingestion_time:.2f}s"
@@ -143,11 +145,10 @@ class TestSeasonSimulation:
         print(f"Successfully ingested {total_deliveries} deliveries in {ingestion_time:.2f}s")
 
     @pytest.mark.performance
-    def test_season_analytics_queries(self, thread_safe_session):
+    def test_season_analytics_queries(self, thread_safe_session, season_table):
         """Test running analytical queries on season data."""
         # Generate and ingest data
-        season_data = self.generate_synthetic_season_data(num_matches=5)
-        arrow_table = pa.Table.from_pandas(season_data)
+        arrow_table = self.first_matches(season_table, 5)
         thread_safe_session.engine.ingest_events(arrow_table, "analytics_test")
 
         # Test various analytical queries
@@ -176,11 +177,18 @@ class TestSeasonSimulation:
             """
         }
 
-        for query_name, sql in queries.items():
+        def timed_query(sql: str):
             start_time = time.time()
+            result = thread_safe_session.engine.execute_sql(sql)
+            return result, time.time() - start_time
+
+        # Read-only queries run concurrently against the thread-safe engine
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            futures = {name: executor.submit(timed_query, sql) for name, sql in queries.items()}
+
+        for query_name, future in futures.items():
             try:
-                result = thread_safe_session.engine.execute_sql(sql)
-                query_time = time.time() - start_time
+                result, query_time = future.result()
 
                 # Verify we got results
                 assert len(result) > 0, f"Query {query_name} returned no results"
@@ -194,33 +202,36 @@ class TestSeasonSimulation:
                 pytest.fail(f"Query {query_name} failed: {e}")
 
     @pytest.mark.performance
-    def test_concurrent_access_simulation(self, thread_safe_session):
+    def test_concurrent_access_simulation(self, thread_safe_session, season_table):
         """Test concurrent read/write operations."""
         import threading
-        import queue
 
-        season_data = self.generate_synthetic_season_data(num_matches=3)
-        arrow_table = pa.Table.from_pandas(season_data)
+        arrow_table = self.first_matches(season_table, 3)
         thread_safe_session.engine.ingest_events(arrow_table, "concurrency_test")
 
-        results_queue = queue.Queue()
+        # Each worker owns one slot, so counting needs no shared lock
+        reader_counts = [0] * 3
+        writer_counts = [0] * 2
         errors = []
+        # Release every worker at once so reads and writes actually overlap
+        start_barrier = threading.Barrier(len(reader_counts) + len(writer_counts), timeout=10)
 
         def reader_worker(worker_id: int):
             """Simulate read operations."""
             try:
+                start_barrier.wait()
                 for i in range(10):
                     result = thread_safe_session.engine.execute_sql(
                         "SELECT COUNT(*) FROM ball_events"
                     )
-                    results_queue.put(f"reader_{worker_id}_{i}")
-                    time.sleep(0.01)  # Small delay
+                    reader_counts[worker_id] += 1
             except Exception as e:
                 errors.append(f"Reader {worker_id}: {e}")
 
         def writer_worker(worker_id: int):
             """Simulate write operations."""
             try:
+                start_barrier.wait()
                 # Insert some live data
                 for i in range(5):
                     thread_safe_session.engine.insert_live_delivery({
@@ -234,8 +245,7 @@ class TestSeasonSimulation:
                         'venue': 'Test Venue',
                         'timestamp': time.time()
                     })
-                    results_queue.put(f"writer_{worker_id}_{i}")
-                    time.sleep(0.01)
+                    writer_counts[worker_id] += 1
             except Exception as e:
                 errors.append(f"Writer {worker_id}: {e}")
 
@@ -243,13 +253,13 @@ class TestSeasonSimulation:
         threads = []
 
         # 3 reader threads
-        for i in range(3):
+        for i in range(len(reader_counts)):
             t = threading.Thread(target=reader_worker, args=(i,))
             threads.append(t)
             t.start()
 
         # 2 writer threads
-        for i in range(2):
+        for i in range(len(writer_counts)):
             t = threading.Thread(target=writer_worker, args=(i,))
             threads.append(t)
             t.start()
@@ -262,11 +272,8 @@ class TestSeasonSimulation:
         if errors:
             pytest.fail(f"Concurrent operations failed: {errors}")
 
-        # Verify we got expected results
-        result_count = 0
-        while not results_queue.empty():
-            results_queue.get()
-            result_count += 1
+        # Verify we got expected results; counts are final once the threads joined
+        result_count = sum(reader_counts) + sum(writer_counts)
 
         expected_operations = (3 * 10) + (2 * 5)  # readers + writers
         assert result_count == expected_operations, f"Expected {expected_operations} operations, got {result_count}"
@@ -274,15 +281,19 @@ class TestSeasonSimulation:
         print(f"Successfully completed {result_count} concurrent operations")
 
     @pytest.mark.performance
-    def test_data_integrity_checks(self, thread_safe_session):
+    def test_data_integrity_checks(self, thread_safe_session, season_table):
         """Test data integrity and consistency checks."""
-        season_data = self.generate_synthetic_season_data(num_matches=2)
+        arrow_table = self.first_matches(season_table, 2)
 
         # Introduce some data quality issues
-        season_data.loc[0, 'runs_total'] = -1  # Invalid negative runs
-        season_data.loc[1, 'wickets_fallen'] = 15  # Invalid wicket count
-
-        arrow_table = pa.Table.from_pandas(season_data)
+        runs_total = arrow_table['runs_total'].to_numpy().copy()
+        runs_total[0] = -1  # Invalid negative runs
+        wickets_fallen = arrow_table['wickets_fallen'].to_numpy().copy()
+        wickets_fallen[1] = 15  # Invalid wicket count
+        arrow_table = arrow_table.set_column(
+            arrow_table.schema.get_field_index('runs_total'), 'runs_total', pa.array(runs_total))
+        arrow_table = arrow_table.set_column(
+            arrow_table.schema.get_field_index('wickets_fallen'), 'wickets_fallen', pa.array(wickets_fallen))
 
         # This should either reject the data or handle it gracefully
         try:
@@ -307,11 +318,10 @@ class TestSeasonSimulation:
             print(f"Data validation prevented invalid data ingestion: {e}")
 
     @pytest.mark.performance
-    def test_performance_regression_check(self, thread_safe_session):
+    def test_performance_regression_check(self, thread_safe_session, season_table):
         """Test for performance regressions in common operations."""
         # Generate larger dataset for performance testing
-        season_data = self.generate_synthetic_season_data(num_matches=20)
-        arrow_table = pa.Table.from_pandas(season_data)
+        arrow_table = season_table
 
         # Measure ingestion performance
         start_time = time.time()
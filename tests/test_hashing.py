@@ -19,6 +19,16 @@ class TestDeterministicHashing(unittest.TestCase):
         
         self.assertNotEqual(h1, h3, "Hash must change if Snapshot ID changes")
 
+    def test_copy_recomputes_hash(self):
+        q1 = MatchupQuery(batter_id="1", bowler_id="2", snapshot_id="snap1")
+        h1 = q1.cache_key
+
+        q2 = q1.model_copy(update={"snapshot_id": "snap2"})
+        expected = MatchupQuery(batter_id="1", bowler_id="2", snapshot_id="snap2").cache_key
+
+        self.assertEqual(q2.cache_key, expected, "A copied query must not reuse the cached hash")
+        self.assertEqual(q1.cache_key, h1)
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -228,6 +228,150 @@ class TestStreamIngestor:
         result = thread_safe_engine.execute_sql("SELECT COUNT(*) as count FROM ball_events")
         assert result['count'][0].as_py() == 1
 
+    def test_live_deliveries_buffered_until_read(self, thread_safe_engine):
+        """Test that live deliveries are batched but visible to reads."""
+        thread_safe_engine.live_flush_rows = 2
+        thread_safe_engine.live_flush_interval = 60
+        for ball in range(1, 4):
+            thread_safe_engine.insert_live_delivery({
+                'match_id': 'buffer_match', 'inning': 1, 'over': 0, 'ball': ball,
+                'runs_total': ball, 'wickets_fallen': 0, 'target': None,
+                'venue': 'Test Stadium', 'timestamp': time.time()
+            })
+
+        # Two rows flushed at the threshold, one still buffered
+        assert len(thread_safe_engine._live_buffer) == 1
+
+        result = thread_safe_engine.execute_sql("SELECT COUNT(*) as count FROM ball_events")
+        assert result['count'][0].as_py() == 3
+
+    def test_live_deliveries_flushed_on_timer(self, thread_safe_engine):
+        """Test that buffered deliveries are written without a read or a full batch."""
+        thread_safe_engine.live_flush_interval = 0.01
+        thread_safe_engine.insert_live_delivery({
+            'match_id': 'timer_match', 'inning': 1, 'over': 0, 'ball': 1,
+            'runs_total': 1, 'wickets_fallen': 0, 'target': None,
+            'venue': 'Test Stadium', 'timestamp': time.time()
+        })
+
+        deadline = time.time() + 5
+        while thread_safe_engine._live_buffer and time.time() < deadline:
+            time.sleep(0.01)
+        assert thread_safe_engine._live_buffer == []
+
+    def test_malformed_live_delivery_fails_alone(self, thread_safe_engine):
+        """Test that a bad delivery raises for its caller without dropping buffered rows."""
+        thread_safe_engine.live_flush_interval = 60
+        delivery = {
+            'match_id': 'bad_match', 'inning': 1, 'over': 0, 'ball': 1,
+            'runs_total': 1, 'wickets_fallen': 0, 'target': None,
+            'venue': 'Test Stadium', 'timestamp': time.time()
+        }
+        for ball in range(1, 6):
+            thread_safe_engine.insert_live_delivery(dict(delivery, ball=ball))
+        with pytest.raises(ValueError):
+            thread_safe_engine.insert_live_delivery(dict(delivery, inning='first'))
+
+        result = thread_safe_engine.execute_sql("SELECT COUNT(*) as count FROM ball_events")
+        assert result['count'][0].as_py() == 5
+
+    def test_failed_live_flush_keeps_rows(self, thread_safe_engine):
+        """Test that rows go back to the buffer when their write fails."""
+        thread_safe_engine.live_flush_interval = 60
+        thread_safe_engine.insert_live_delivery({
+            'match_id': 'retry_match', 'inning': 1, 'over': 0, 'ball': 1,
+            'runs_total': 1, 'wickets_fallen': 0, 'target': None,
+            'venue': 'Test Stadium', 'timestamp': time.time()
+        })
+        thread_safe_engine.pool.run_write(lambda conn: conn.execute("ALTER TABLE ball_events RENAME TO ball_events_old"))
+        with pytest.raises(Exception):
+            thread_safe_engine.flush_live()
+        assert len(thread_safe_engine._live_buffer) == 1
+
+        thread_safe_engine.pool.run_write(lambda conn: conn.execute("ALTER TABLE ball_events_old RENAME TO ball_events"))
+        thread_safe_engine.flush_live()
+        result = thread_safe_engine.execute_sql("SELECT COUNT(*) as count FROM ball_events")
+        assert result['count'][0].as_py() == 1
+
+    def test_background_flush_error_raised_to_producer(self, thread_safe_engine):
+        """Test that a failed timer flush keeps its rows and surfaces on the next insert."""
+        delivery = {
+            'match_id': 'timer_fail', 'inning': 1, 'over': 0, 'ball': 1,
+            'runs_total': 1, 'wickets_fallen': 0, 'target': None,
+            'venue': 'Test Stadium', 'timestamp': time.time()
+        }
+        thread_safe_engine.pool.run_write(lambda conn: conn.execute("ALTER TABLE ball_events RENAME TO ball_events_old"))
+        thread_safe_engine.live_flush_interval = 0.01
+        thread_safe_engine.insert_live_delivery(delivery)
+
+        deadline = time.time() + 5
+        while thread_safe_engine._live_error is None and time.time() < deadline:
+            time.sleep(0.01)
+        # Stop the timer so no further background flush races the asserts
+        thread_safe_engine._live_stop.set()
+        thread_safe_engine._live_flusher.join()
+        with pytest.raises(Exception):
+            thread_safe_engine.insert_live_delivery(dict(delivery, ball=2))
+        assert len(thread_safe_engine._live_buffer) == 1
+
+        thread_safe_engine.pool.run_write(lambda conn: conn.execute("ALTER TABLE ball_events_old RENAME TO ball_events"))
+        thread_safe_engine.insert_live_delivery(dict(delivery, ball=2))
+        result = thread_safe_engine.execute_sql("SELECT COUNT(*) as count FROM ball_events")
+        assert result['count'][0].as_py() == 2
+
+    def test_read_results_cached_until_write(self, thread_safe_engine):
+        """Test that repeated reads are cached and invalidated by writes."""
+        delivery = {
+            'match_id': 'cache_match', 'inning': 1, 'over': 0, 'ball': 1,
+            'runs_total': 1, 'wickets_fallen': 0, 'target': None,
+            'venue': 'Test Stadium', 'timestamp': time.time()
+        }
+        thread_safe_engine.insert_live_delivery(delivery)
+
+        sql = "SELECT COUNT(*) as count FROM ball_events"
+        first = thread_safe_engine.execute_sql(sql, cache=True)
+        assert thread_safe_engine.execute_sql(sql, cache=True) is first
+        # Uncached reads always run the query
+        assert thread_safe_engine.execute_sql(sql) is not first
+
+        thread_safe_engine.insert_live_delivery(dict(delivery, ball=2))
+        assert thread_safe_engine.execute_sql(sql, cache=True)['count'][0].as_py() == 2
+
+    def test_write_pool_size_is_deprecated(self):
+        """Test that asking for more than one writer warns instead of being silently ignored."""
+        from pypitch.storage.thread_safe_engine import ConnectionPool
+        with pytest.warns(DeprecationWarning, match="write_pool_size"):
+            pool = ConnectionPool(":memory:", write_pool_size=2)
+        pool.close()
+
+    def test_close_stops_pool_when_flush_fails(self, thread_safe_engine):
+        """Test that close() still shuts the writer down if the final flush raises."""
+        def failing_flush():
+            raise RuntimeError("flush failed")
+        thread_safe_engine._flush_live = failing_flush
+        with pytest.raises(RuntimeError):
+            thread_safe_engine.close()
+        assert not thread_safe_engine.pool._writer.is_alive()
+        del thread_safe_engine._flush_live
+
+    def test_timed_out_write_invalidates_cache(self, thread_safe_engine):
+        """Test that a write the caller stopped waiting for still drops cached reads."""
+        sql = "SELECT COUNT(*) as count FROM ball_events"
+        assert thread_safe_engine.execute_sql(sql, cache=True)['count'][0].as_py() == 0
+
+        # Hold the writer so the next write outlives its timeout
+        release = threading.Event()
+        blocker = thread_safe_engine.pool.submit_write(lambda conn: release.wait())
+        with pytest.raises(Exception):
+            thread_safe_engine.execute_sql(
+                "INSERT INTO ball_events (match_id) VALUES ('late')", read_only=False, timeout=0.05
+            )
+        release.set()
+        blocker.result()
+        thread_safe_engine.pool.run_write(lambda conn: None)
+
+        assert thread_safe_engine.execute_sql(sql, cache=True)['count'][0].as_py() == 1
+
     def test_ingest_delivery_data_invalid(self, thread_safe_engine):
         """Test ingesting invalid delivery data."""
         ingestor = StreamIngestor(thread_safe_engine)
@@ -58,7 +58,7 @@ def test_cache_behavior(registry):
     id1 = registry.resolve_player(name, d1, auto_ingest=True)
     
     # Verify it"s in cache
-    cache_key = f"P:{name}:{d1}"
+    cache_key = ("player", name, d1)
     assert cache_key in registry._cache
     assert registry._cache[cache_key] == id1
     
@@ -66,3 +66,105 @@ def test_cache_behavior(registry):
     id2 = registry.resolve_player(name, d1)
     assert id1 == id2
 
+
+def test_upsert_player_stats_overwrites(registry):
+    registry.upsert_player_stats({1: {"matches": 1, "runs": 10, "balls_faced": 8, "wickets": 0, "balls_bowled": 0, "runs_conceded": 0}})
+    registry.upsert_player_stats({
+        1: {"matches": 2, "runs": 45, "balls_faced": 30, "wickets": 1, "balls_bowled": 12, "runs_conceded": 20},
+        2: {"matches": 1, "runs": 5, "balls_faced": 4, "wickets": 0, "balls_bowled": 0, "runs_conceded": 0},
+    })
+
+    assert registry.get_player_stats(1)["runs"] == 45
+    assert registry.get_player_stats(2)["matches"] == 1
+
+def test_upsert_venue_stats_overwrites(registry):
+    registry.upsert_venue_stats({7: {"matches": 1, "total_runs": 300, "first_innings_runs": 160, "first_innings_count": 1}})
+    registry.upsert_venue_stats({7: {"matches": 2, "total_runs": 620, "first_innings_runs": 340, "first_innings_count": 2}})
+
+    stats = registry.get_venue_stats(7)
+    assert stats["matches"] == 2
+    assert stats["avg_first_innings"] == 170
+
+def test_aliases_preloaded_on_open(tmp_path):
+    db_path = str(tmp_path / "registry.duckdb")
+    reg = IdentityRegistry(db_path)
+    pid = reg.resolve_player("MS Dhoni", date(2010, 4, 1), auto_ingest=True)
+    reg.close()
+
+    reopened = IdentityRegistry(db_path)
+    try:
+        assert "MS Dhoni" in reopened._alias_index
+        assert reopened.resolve_player("MS Dhoni", date(2015, 4, 1)) == pid
+    finally:
+        reopened.close()
+
+def test_open_ended_aliases_migrated_once(tmp_path):
+    import duckdb
+    db_path = str(tmp_path / "legacy.duckdb")
+    con = duckdb.connect(db_path)
+    con.execute("""
+        CREATE TABLE aliases (alias VARCHAR, entity_id INTEGER, valid_from DATE, valid_to DATE,
+                              PRIMARY KEY (alias, valid_from));
+        INSERT INTO aliases VALUES ('R Ashwin', 7, '2010-06-01', NULL);
+    """)
+    con.close()
+
+    reg = IdentityRegistry(db_path)
+    try:
+        assert reg.con.execute("SELECT valid_to FROM aliases").fetchone()[0] == date(9999, 12, 31)
+        assert reg.con.execute(
+            "SELECT column_default IS NOT NULL FROM duckdb_columns() "
+            "WHERE table_name = 'aliases' AND column_name = 'valid_to'"
+        ).fetchone()[0]
+        assert reg.resolve_player("R Ashwin", date(2020, 1, 1)) == 7
+    finally:
+        reg.close()
+
+def test_auto_ingest_ids_are_unique(registry):
+    d1 = date(2022, 1, 1)
+    ids = [registry.resolve_player(f"Player {i}", d1, auto_ingest=True) for i in range(1200)]
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+
+def test_batch_rollback_discards_new_entities(registry):
+    d1 = date(2023, 1, 1)
+    with pytest.raises(RuntimeError):
+        with registry.batch():
+            registry.resolve_player("Ghost Player", d1, auto_ingest=True)
+            raise RuntimeError("abort ingest")
+
+    with pytest.raises(EntityNotFoundError):
+        registry.resolve_player("Ghost Player", d1)
+
+    with registry.batch():
+        pid = registry.resolve_player("Real Player", d1, auto_ingest=True)
+    assert registry.resolve_player("Real Player", d1) == pid
+
+def test_get_player_stats_batch(registry):
+    registry.upsert_player_stats({
+        3: {"matches": 4, "runs": 120, "balls_faced": 90, "wickets": 0, "balls_bowled": 0, "runs_conceded": 0},
+        4: {"matches": 2, "runs": 10, "balls_faced": 12, "wickets": 3, "balls_bowled": 48, "runs_conceded": 55},
+    })
+
+    table = registry.get_player_stats_batch([4, 3, 99])
+    rows = {r["entity_id"]: r for r in table.to_pylist()}
+    assert set(rows) == {3, 4}
+    assert rows[4]["wickets"] == 3
+
+def test_auto_ingest_reuses_alias_added_externally(registry):
+    registry.con.execute("INSERT INTO entities (id, type, primary_name) VALUES (500, 'player', 'Shubman Gill')")
+    registry.con.execute("INSERT INTO aliases VALUES ('S Gill', 500, '2018-01-01', NULL)")
+
+    assert registry.resolve_player("S Gill", date(2024, 1, 1), auto_ingest=True) == 500
+    assert registry.con.execute("SELECT count(*) FROM entities").fetchone()[0] == 1
+
+def test_cache_is_bounded(registry):
+    registry._cache_max = 2
+    d1 = date(2021, 6, 1)
+    for name in ("A One", "B Two", "C Three"):
+        registry.resolve_player(name, d1, auto_ingest=True)
+
+    assert len(registry._cache) == 2
+    assert ("player", "A One", d1) not in registry._cache
+    # Evicted entries still resolve from the alias index
+    assert registry.resolve_player("A One", d1) > 0
@@ -170,5 +170,153 @@ class TestRobustness(unittest.TestCase):
         self.assertIsNone(rows[0]['runs'])
         self.assertEqual(rows[0]['balls'], 0)
 
+    def test_buffered_appends_visible_to_queries(self):
+        """
+        Test that small appends are buffered but always visible to reads.
+        """
+        print("\n🧪 Testing Buffered Appends...")
+        m1 = self._create_dummy_match(501, "2024-05-01", "KL Rahul", "M Siraj", 2)
+        m2 = self._create_dummy_match(502, "2024-05-02", "KL Rahul", "M Siraj", 3)
+        self.engine.ingest_events(canonicalize_match(m1, self.registry), snapshot_tag="snap_buf", append=True)
+        self.engine.ingest_events(canonicalize_match(m2, self.registry), snapshot_tag="snap_buf", append=True)
+        self.assertEqual(len(self.engine._pending_batches), 2)
+
+        total = self.engine.execute_sql("SELECT SUM(runs_batter) AS runs FROM ball_events").to_pylist()[0]['runs']
+        self.assertEqual(total, 5)
+        self.assertEqual(self.engine._pending_batches, [])
+        self.assertEqual(self.engine.snapshot_id, "snap_buf")
+
+    def test_snapshot_id_flushes_buffered_appends(self):
+        """
+        Test that reading snapshot_id writes buffered appends before reporting them.
+        """
+        print("\n🧪 Testing Snapshot Flush...")
+        m1 = self._create_dummy_match(521, "2024-05-21", "D Padikkal", "Y Chahal", 1)
+        self.engine.ingest_events(canonicalize_match(m1, self.registry), snapshot_tag="snap_read", append=True)
+        self.assertEqual(self.engine.snapshot_id, "snap_read")
+        self.assertEqual(self.engine._pending_batches, [])
+
+    def test_failed_flush_keeps_buffered_appends(self):
+        """
+        Test that a failed flush leaves the appended batches buffered.
+        """
+        print("\n🧪 Testing Failed Flush...")
+        m1 = self._create_dummy_match(511, "2024-05-11", "S Iyer", "R Jadeja", 4)
+        self.engine.ingest_events(canonicalize_match(m1, self.registry), snapshot_tag="snap_fail", append=True)
+
+        write_events = self.engine._write_events
+        def failing_write(*args, **kwargs):
+            raise RuntimeError("disk full")
+        self.engine._write_events = failing_write
+        with self.assertRaises(RuntimeError):
+            self.engine.flush()
+        self.assertEqual(len(self.engine._pending_batches), 1)
+        self.assertEqual(self.engine._snapshot_id, "initial_empty")
+
+        self.engine._write_events = write_events
+        self.engine.flush()
+        total = self.engine.execute_sql("SELECT SUM(runs_batter) AS runs FROM ball_events").to_pylist()[0]['runs']
+        self.assertEqual(total, 4)
+        self.assertEqual(self.engine.snapshot_id, "snap_fail")
+
+    def test_sql_result_cache_invalidated_by_ingest(self):
+        """
+        Test that repeated reads are served from the result cache until new data lands.
+        """
+        print("\n🧪 Testing SQL Result Cache...")
+        m1 = self._create_dummy_match(601, "2024-06-01", "H Pandya", "K Yadav", 4)
+        t1 = canonicalize_match(m1, self.registry)
+        self.engine.ingest_events(t1, snapshot_tag="snap_rc_1")
+
+        sql = "SELECT SUM(runs_batter) AS runs FROM ball_events"
+        first = self.engine.execute_sql(sql, cache=True)
+        self.assertIs(self.engine.execute_sql(sql, cache=True), first)
+        # Uncached reads always run the query
+        self.assertIsNot(self.engine.execute_sql(sql), first)
+
+        m2 = self._create_dummy_match(602, "2024-06-02", "H Pandya", "K Yadav", 6)
+        self.engine.ingest_events(canonicalize_match(m2, self.registry), snapshot_tag="snap_rc_2", append=True)
+        self.assertEqual(self.engine.execute_sql(sql, cache=True).to_pylist()[0]['runs'], 10)
+
+    def test_sql_result_cache_under_concurrent_writes(self):
+        """
+        Test that reads racing live writes never fail or leave a stale cached count.
+        """
+        print("\n🧪 Testing SQL Result Cache Concurrency...")
+        import threading
+        delivery = dict(match_id="m1", inning=1, over=0, ball=1, runs_total=0, wickets_fallen=0)
+        self.engine.insert_live_delivery(delivery)
+        sql = "SELECT COUNT(*) AS n FROM ball_events"
+        errors = []
+        stop = threading.Event()
+
+        def reader():
+            while not stop.is_set():
+                try:
+                    self.engine.execute_sql(sql, cache=True)
+                except Exception as e:
+                    errors.append(e)
+
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        for t in readers:
+            t.start()
+        for i in range(40):
+            self.engine.insert_live_delivery(dict(delivery, over=i + 1))
+        stop.set()
+        for t in readers:
+            t.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(self.engine.execute_sql(sql, cache=True).to_pylist()[0]['n'], 41)
+
+    def test_match_plots_share_cached_result(self):
+        """
+        Test that the per-ball query shared by the match plots is cached until the next write.
+        """
+        print("\n🧪 Testing Shared Match Plot Query...")
+        from pypitch.visuals.worm import _MATCH_BALLS_SQL
+        m1 = self._create_dummy_match(901, "2024-09-01", "S Samson", "T Boult", 4)
+        t1 = canonicalize_match(m1, self.registry)
+        self.engine.ingest_events(t1, snapshot_tag="snap_plots")
+        params = [t1.column('match_id')[0].as_py()]
+
+        first = self.engine.execute_sql(_MATCH_BALLS_SQL, params, cache=True)
+        self.assertEqual(first.num_rows, 1)
+        self.assertIs(self.engine.execute_sql(_MATCH_BALLS_SQL, params, cache=True), first)
+
+        self.engine.ingest_events(t1, snapshot_tag="snap_plots", append=True)
+        self.assertEqual(self.engine.execute_sql(_MATCH_BALLS_SQL, params, cache=True).num_rows, 2)
+
+    def test_pooled_connections_share_database(self):
+        """
+        Test that every pooled connection sees the same (in-memory) database.
+        """
+        print("\n🧪 Testing Pooled Connections...")
+        m1 = self._create_dummy_match(701, "2024-07-01", "Y Jaiswal", "A Nortje", 4)
+        self.engine.ingest_events(canonicalize_match(m1, self.registry), snapshot_tag="snap_pool")
+
+        held = [self.engine.pool.get_connection() for _ in range(3)]
+        try:
+            counts = [c.execute("SELECT COUNT(*) FROM ball_events").fetchone()[0] for c in held]
+        finally:
+            for c in held:
+                self.engine.pool.return_connection(c)
+        self.assertEqual(counts, [1, 1, 1])
+
+    def test_streamed_results(self):
+        """
+        Test that stream=True yields record batches matching the materialized result.
+        """
+        print("\n🧪 Testing Streamed Results...")
+        m1 = self._create_dummy_match(801, "2024-08-01", "R Pant", "M Shami", 2)
+        self.engine.ingest_events(canonicalize_match(m1, self.registry), snapshot_tag="snap_stream")
+
+        sql = "SELECT match_id, runs_batter FROM ball_events"
+        reader = self.engine.execute_sql(sql, stream=True)
+        self.assertIsInstance(reader, pa.RecordBatchReader)
+        # The pool stays usable while the stream is open
+        self.assertEqual(self.engine.execute_sql("SELECT 1 AS one").to_pylist(), [{"one": 1}])
+        self.assertEqual(reader.read_all().to_pylist(), self.engine.execute_sql(sql).to_pylist())
+
 if __name__ == '__main__':
     unittest.main()
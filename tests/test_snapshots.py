@@ -0,0 +1,17 @@
+from pypitch.storage.snapshots import SnapshotManager
+
+def test_latest_defaults_to_initial(tmp_path):
+    manager = SnapshotManager(str(tmp_path))
+    assert manager.get_latest() == "initial"
+
+def test_snapshots_persist_across_instances(tmp_path):
+    manager = SnapshotManager(str(tmp_path))
+    manager.create_snapshot("2024-01-01", "first load")
+    manager.create_snapshot("2024-01-02")
+
+    assert manager.get_latest() == "2024-01-02"
+    assert not (tmp_path / "snapshots.json.tmp").exists()
+
+    reloaded = SnapshotManager(str(tmp_path))
+    assert reloaded.get_latest() == "2024-01-02"
+    assert [s["id"] for s in reloaded.history["snapshots"]] == ["2024-01-01", "2024-01-02"]